@@ -45,18 +45,15 @@ def main():
         sim = LTSpice()
         results = sim.run(circuit)
 
-        # Get frequency and output voltage
+        # Get frequency points
         freq = results.get_frequency()
-        vout = results.get_voltage("out")
 
         print(f"\nSimulation completed!")
         print(f"  Points: {len(freq)}")
         print(f"  Frequency range: {freq[0]:.1f} Hz to {freq[-1]:.0f} Hz")
 
         # Find -3dB point (cutoff frequency)
-        import numpy as np
-        vout_db = 20 * np.log10(vout)
-        idx_3db = np.argmin(np.abs(vout_db - (-3)))
+        idx_3db = results.nearest_index("out", 10 ** (-3 / 20))
         fc_measured = freq[idx_3db]
         print(f"  Measured -3dB frequency: {fc_measured:.0f} Hz")
         print(f"  Theoretical cutoff: 1000 Hz")
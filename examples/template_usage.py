@@ -103,7 +103,7 @@ print("-" * 60)
 circuit = filters.rc_lowpass(fc=1000, r=1000, include_source=False)
 
 # Add custom source
-circuit.add_voltage_source("Vin", "in", "0", dc=5, ac=1, sine={"amplitude": 1, "frequency": 100})
+circuit.add_voltage_source("Vin", "in", "0", dc=5, ac=1, sine={"va": 1, "freq": 100})
 
 # Add custom analysis
 circuit.add_transient_analysis(stop_time=0.02, step_time=0.0001)
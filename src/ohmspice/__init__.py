@@ -16,34 +16,72 @@ Example:
 __version__ = "0.2.0"
 __author__ = "Eray Erdogan"
 
-# Core classes
-from ohmspice.circuit import Circuit
+import importlib
+from typing import TYPE_CHECKING, Any
 
-# Components
-from ohmspice.components import (
-    Capacitor,
-    Component,
-    CurrentSource,
-    Inductor,
-    Resistor,
-    VoltageSource,
-    format_value,
-    parse_value,
-)
-from ohmspice.netlist import NetlistGenerator
-
-# Simulators - import conditionally to avoid errors if dependencies missing
-try:
+if TYPE_CHECKING:
+    from ohmspice.analysis import SimulationResults
+    from ohmspice.circuit import Circuit
+    from ohmspice.components import (
+        Capacitor,
+        Component,
+        CurrentSource,
+        Inductor,
+        Resistor,
+        VoltageSource,
+        format_value,
+        parse_value,
+    )
+    from ohmspice.netlist import NetlistGenerator
     from ohmspice.simulators import LTSpice, Simulator
-except ImportError:
-    LTSpice = None  # type: ignore
-    Simulator = None  # type: ignore
 
-# Analysis results
-try:
-    from ohmspice.analysis import SimulationResults
-except ImportError:
-    SimulationResults = None  # type: ignore
+# Public names are imported on first access (PEP 562) so that netlist-only
+# scripts do not pay for NumPy and the simulator backends.
+_LAZY_IMPORTS = {
+    # Core classes
+    "Circuit": "ohmspice.circuit",
+    "NetlistGenerator": "ohmspice.netlist",
+    # Components
+    "Component": "ohmspice.components",
+    "Resistor": "ohmspice.components",
+    "Capacitor": "ohmspice.components",
+    "Inductor": "ohmspice.components",
+    "VoltageSource": "ohmspice.components",
+    "CurrentSource": "ohmspice.components",
+    "parse_value": "ohmspice.components",
+    "format_value": "ohmspice.components",
+    # Simulators
+    "Simulator": "ohmspice.simulators",
+    "LTSpice": "ohmspice.simulators",
+    # Analysis results
+    "SimulationResults": "ohmspice.analysis",
+}
+
+# Modules whose dependencies may be missing; their names resolve to None instead
+_OPTIONAL_MODULES = {"ohmspice.simulators", "ohmspice.analysis"}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        if module_name not in _OPTIONAL_MODULES:
+            raise
+        value = None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily imported names in dir()."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Version
@@ -3,7 +3,14 @@
 Supports parsing LTspice .raw binary files.
 """
 
-import struct
+import contextlib
+import json
+import mmap
+import os
+import re
+import zipfile
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 from typing import Any
@@ -11,6 +18,32 @@ from typing import Any
 import numpy as np
 import numpy.typing as npt
 
+#: Number of leading bytes searched for the end-of-header marker
+HEADER_SEARCH_LIMIT = 65536
+
+_BINARY_MARKER = b"Binary:\n"
+_BINARY_MARKER_UTF16 = "Binary:\n".encode("utf-16-le")
+_VALUES_MARKER = b"Values:\n"
+
+_ALL_POINTS = slice(None)
+
+_HEADER_FIELD_RE = re.compile(
+    r"^[ \t]*(Plotname|Flags|No\. Points|No\. Variables):[ \t]*(.*?)[ \t\r]*$",
+    re.MULTILINE | re.IGNORECASE,
+)
+_VARIABLES_RE = re.compile(r"^[ \t]*Variables:.*$", re.MULTILINE | re.IGNORECASE)
+_VARIABLE_RE = re.compile(r"^[ \t]*(\d+)[ \t]+(\S+)[ \t]+(\S+)", re.MULTILINE)
+
+
+def _is_utf16(head: bytes) -> bool:
+    """Check whether a .raw header is UTF-16-LE encoded from its first bytes."""
+    return head[:2] == b"\xff\xfe" or (head[1:2] == b"\x00" and head[3:4] == b"\x00")
+
+
+def _real(values: npt.NDArray[Any]) -> npt.NDArray[Any]:
+    """Return the real part of an array as a view, without copying."""
+    return values.real if np.iscomplexobj(values) else values
+
 
 class AnalysisType(Enum):
     """Types of SPICE analysis."""
@@ -42,11 +75,29 @@ class SimulationResults:
         data: Dictionary mapping variable names to numpy arrays.
     """
 
-    def __init__(self, raw_file: str | Path) -> None:
+    #: Suffix appended to the .raw file name for the parsed-results cache
+    CACHE_SUFFIX = ".cache.npz"
+
+    def __init__(
+        self,
+        raw_file: str | Path,
+        *,
+        use_cache: bool = False,
+        copy: bool = True,
+    ) -> None:
         """Load and parse a .raw file.
 
         Args:
             raw_file: Path to the LTspice .raw file.
+            use_cache: Store parsed data in a sidecar ``.raw.cache.npz`` file
+                and reuse it while the .raw file's mtime and size are unchanged.
+            copy: Copy all variables out of the file into memory while
+                loading. If False, variables are read-only views into the
+                memory-mapped file, so only the pages actually read are
+                loaded. The file then stays mapped for as long as the results
+                or any such view are alive, and must not be modified or
+                truncated in the meantime: views reflect the new contents,
+                and reading past a truncated end crashes the interpreter.
 
         Raises:
             FileNotFoundError: If the file doesn't exist.
@@ -61,97 +112,218 @@ class SimulationResults:
         self._variable_types: list[str] = []
         self._num_points = 0
         self._is_complex = False
+        self._copy = copy
         self.data: dict[str, npt.NDArray[Any]] = {}
 
+        # All variables as columns of one (points x variables) array, with
+        # data entries being views into its columns
+        self._matrix: npt.NDArray[Any] = np.empty((0, 0))
+        self._columns: dict[str, int] = {}
+
+        if use_cache:
+            self._load_cached()
+        else:
+            self._parse()
+
+        # Independent variable arrays, resolved on first access
+        self._frequency: npt.NDArray[Any] | None = None
+        self._time: npt.NDArray[Any] | None = None
+
+        # Magnitude/phase arrays derived from complex variables, by name
+        self._magnitudes: dict[str, npt.NDArray[Any]] = {}
+        self._phases: dict[str, npt.NDArray[Any]] = {}
+
+        # Case-insensitive index of variable names for node/component lookups
+        self._lookup: dict[str, str] = {}
+        for name in self.data:
+            self._lookup.setdefault(name.lower(), name)
+
+    @classmethod
+    def load_many(
+        cls,
+        raw_files: Iterable[str | Path],
+        *,
+        max_workers: int | None = None,
+        use_cache: bool = False,
+        copy: bool = True,
+    ) -> list["SimulationResults"]:
+        """Load several .raw files in parallel.
+
+        Parsing is dominated by file I/O and NumPy copies, which release the
+        GIL, so a thread pool is used.
+
+        Args:
+            raw_files: Paths to LTspice .raw files.
+            max_workers: Maximum number of worker threads. Defaults to the
+                ThreadPoolExecutor default; ``os.cpu_count()`` is a good
+                choice for large parameter sweeps.
+            use_cache: Passed to each SimulationResults.
+            copy: Passed to each SimulationResults.
+
+        Returns:
+            Results in the same order as ``raw_files``.
+
+        Raises:
+            FileNotFoundError: If any file doesn't exist.
+            ValueError: If any file format is invalid.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda path: cls(path, use_cache=use_cache, copy=copy), raw_files)
+            )
+
+    @property
+    def cache_file(self) -> Path:
+        """Path of the sidecar cache file for this .raw file."""
+        return self.raw_file.with_name(self.raw_file.name + self.CACHE_SUFFIX)
+
+    def _cache_key(self) -> list[int]:
+        """Identify the current .raw file contents by mtime and size."""
+        stat = self.raw_file.stat()
+        return [stat.st_mtime_ns, stat.st_size]
+
+    def _load_cached(self) -> None:
+        """Populate results from the sidecar cache, parsing on a miss."""
+        key = self._cache_key()
+
+        try:
+            with np.load(self.cache_file, allow_pickle=False) as archive:
+                meta = json.loads(str(archive["meta"]))
+                if meta["key"] == key:
+                    self.analysis_type = AnalysisType(meta["analysis_type"])
+                    self.variables = meta["variables"]
+                    self._variable_types = meta["variable_types"]
+                    self._num_points = meta["num_points"]
+                    self._is_complex = meta["is_complex"]
+                    self._matrix = archive["matrix"]
+                    if self._matrix.size:
+                        self._bind_columns()
+                    return
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+            # Missing or unreadable cache - fall back to parsing
+            pass
+
         self._parse()
+        self._save_cache(key)
+
+    def _save_cache(self, key: list[int]) -> None:
+        """Write parsed results to the sidecar cache file."""
+        meta = {
+            "key": key,
+            "analysis_type": self.analysis_type.value,
+            "variables": self.variables,
+            "variable_types": self._variable_types,
+            "num_points": self._num_points,
+            "is_complex": self._is_complex,
+        }
+
+        try:
+            with open(self.cache_file, "wb") as f:
+                np.savez(f, meta=np.array(json.dumps(meta)), matrix=self.matrix)
+        except OSError:
+            # Caching is best-effort; results are already parsed
+            pass
 
     def _parse(self) -> None:
         """Parse the .raw file."""
-        # Read raw file in binary mode
-        content = self.raw_file.read_bytes()
+        # Map the file instead of reading it so the binary section is never
+        # copied into a bytes object before being decoded
+        with open(self.raw_file, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError("Could not find end of header in .raw file")
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
 
+        try:
+            self._parse_content(content)
+        except BaseException:
+            # Still referenced by the in-flight exception if closing fails;
+            # the mapping is then released on garbage collection
+            with contextlib.suppress(BufferError):
+                content.close()
+            raise
+
+        # Every column has been copied out by now. With copy=False the
+        # mapping instead stays open for as long as views into it are alive
+        if self._copy:
+            content.close()
+
+    def _parse_content(self, content: mmap.mmap) -> None:
+        """Parse the mapped contents of a .raw file."""
         # LTspice .raw files have a text header followed by binary data
         # The header is ASCII/UTF-16 depending on version
         header_end = self._find_header_end(content)
         if header_end == -1:
             raise ValueError("Could not find end of header in .raw file")
 
-        # Try to decode header as UTF-16 first, then ASCII
-        try:
-            header = content[:header_end].decode("utf-16-le")
-        except UnicodeDecodeError:
-            try:
-                header = content[:header_end].decode("ascii", errors="ignore")
-            except Exception:
-                header = content[:header_end].decode("latin-1", errors="ignore")
+        # Pick the codec up front instead of relying on a failed decode
+        codec = "utf-16-le" if _is_utf16(content[:4]) else "ascii"
+        header = content[:header_end].decode(codec, errors="ignore")
 
         # Parse header
         self._parse_header(header)
 
         # Parse binary data
-        binary_data = content[header_end:]
-        self._parse_binary_data(binary_data)
+        self._parse_binary_data(content, header_end)
 
-    def _find_header_end(self, content: bytes) -> int:
+    def _find_header_end(self, content: bytes | mmap.mmap) -> int:
         """Find the end of the header section."""
-        # Look for "Binary:" or "Values:" marker
-        markers = [b"Binary:\n", b"B\x00i\x00n\x00a\x00r\x00y\x00:\x00\n\x00"]
+        # The header sits at the start of the file, so only scan a bounded
+        # prefix instead of the whole (potentially very large) data section
+        head = content[:HEADER_SEARCH_LIMIT]
+
+        # Try the marker matching the header encoding first
+        markers = (
+            [_BINARY_MARKER_UTF16, _BINARY_MARKER]
+            if _is_utf16(head)
+            else [_BINARY_MARKER, _BINARY_MARKER_UTF16]
+        )
+        # Also check for ASCII "Values:" for ASCII format
+        markers.append(_VALUES_MARKER)
 
         for marker in markers:
-            pos = content.find(marker)
+            pos = head.find(marker)
             if pos != -1:
                 return pos + len(marker)
 
-        # Also check for ASCII "Values:" for ASCII format
-        values_marker = content.find(b"Values:\n")
-        if values_marker != -1:
-            return values_marker + len(b"Values:\n")
+        # Headers with very many variables can exceed the bounded prefix
+        if len(content) > HEADER_SEARCH_LIMIT:
+            for marker in markers:
+                pos = content.find(marker)
+                if pos != -1:
+                    return pos + len(marker)
 
         return -1
 
     def _parse_header(self, header: str) -> None:
         """Parse the text header."""
-        lines = header.strip().split("\n")
-
-        in_variables = False
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        # Key-value pairs come first, followed by the variable table
+        marker = _VARIABLES_RE.search(header)
+        fields_end = marker.start() if marker else len(header)
+
+        for match in _HEADER_FIELD_RE.finditer(header, 0, fields_end):
+            key = match.group(1).lower()
+            value = match.group(2)
+
+            if key == "plotname":
+                self.analysis_type = self._parse_analysis_type(value)
+            elif key == "flags":
+                self._is_complex = "complex" in value.lower()
+            elif key == "no. points":
+                self._num_points = int(value)
+            elif key == "no. variables":
+                num_vars = int(value)
+                self.variables = [""] * num_vars
+                self._variable_types = [""] * num_vars
+
+        if marker is None:
+            return
 
-            # Parse key-value pairs
-            if ":" in line and not in_variables:
-                key, _, value = line.partition(":")
-                key = key.strip().lower()
-                value = value.strip()
-
-                if key == "plotname":
-                    self.analysis_type = self._parse_analysis_type(value)
-                elif key == "flags":
-                    self._is_complex = "complex" in value.lower()
-                elif key == "no. points":
-                    self._num_points = int(value)
-                elif key == "no. variables":
-                    num_vars = int(value)
-                    self.variables = [""] * num_vars
-                    self._variable_types = [""] * num_vars
-                elif key == "variables":
-                    in_variables = True
-
-            elif in_variables:
-                # Variable definitions: index name type
-                parts = line.split()
-                if len(parts) >= 3:
-                    try:
-                        idx = int(parts[0])
-                        name = parts[1]
-                        var_type = parts[2]
-                        if idx < len(self.variables):
-                            self.variables[idx] = name
-                            self._variable_types[idx] = var_type
-                    except (ValueError, IndexError):
-                        pass
+        # Variable definitions: index name type
+        for match in _VARIABLE_RE.finditer(header, marker.end()):
+            idx = int(match.group(1))
+            if idx < len(self.variables):
+                self.variables[idx] = match.group(2)
+                self._variable_types[idx] = match.group(3)
 
     def _parse_analysis_type(self, plotname: str) -> AnalysisType:
         """Parse analysis type from plotname."""
@@ -168,8 +340,13 @@ class SimulationResults:
             return AnalysisType.NOISE
         return AnalysisType.UNKNOWN
 
-    def _parse_binary_data(self, data: bytes) -> None:
-        """Parse binary data section."""
+    def _parse_binary_data(self, data: bytes | mmap.mmap, offset: int = 0) -> None:
+        """Parse binary data section.
+
+        Args:
+            data: Buffer holding the .raw file contents.
+            offset: Byte offset where the binary section starts.
+        """
         if not self.variables or self._num_points == 0:
             return
 
@@ -183,38 +360,78 @@ class SimulationResults:
         # Transient/DC: all doubles (8 bytes each)
         point_size = 8 + (num_vars - 1) * 16 if self._is_complex else num_vars * 8
 
-        expected_size = point_size * self._num_points
-        if len(data) < expected_size:
-            # Try with different assumptions
-            self._num_points = len(data) // point_size
+        # Trust the header unless the file was truncated mid-simulation
+        self._num_points = num_points = min(self._num_points, (len(data) - offset) // point_size)
+
+        # View the binary section as one row of bytes per point and let numpy
+        # reinterpret the columns instead of unpacking values one at a time
+        raw = np.frombuffer(
+            data, dtype=np.uint8, count=point_size * num_points, offset=offset
+        ).reshape(num_points, point_size)
+
+        if self._is_complex:
+            # Independent variable is a double, the rest are complex doubles
+            sources = [raw[:, :8].view("<f8")[:, 0]]
+            values = raw[:, 8:].view("<c16")
+            sources += [values[:, i] for i in range(num_vars - 1)]
+        else:
+            values = raw.view("<f8")
+            sources = [values[:, i] for i in range(num_vars)]
+
+        if not self._copy:
+            # Zero-copy: data entries are views into the mapped file
+            self._bind_columns(sources)
+            return
+
+        # Copy every column out of the file now, so later changes to the
+        # .raw file (a rerun, truncation) cannot affect these results.
+        # Column-major so every variable is a contiguous column
+        self._matrix = matrix = self._empty_matrix()
+        for i, source in enumerate(sources):
+            matrix[:, i] = source
+        self._bind_columns()
+
+    def _empty_matrix(self) -> npt.NDArray[Any]:
+        """Allocate an uninitialized (points x variables) matrix."""
+        dtype = np.complex128 if self._is_complex else np.float64
+        return np.empty((self._num_points, len(self.variables)), dtype=dtype, order="F")
+
+    def _bind_columns(self, sources: list[npt.NDArray[Any]] | None = None) -> None:
+        """Expose each variable through ``data``.
 
-        # Initialize arrays
-        for i, var_name in enumerate(self.variables):
-            if self._is_complex and i > 0:
-                self.data[var_name] = np.zeros(self._num_points, dtype=np.complex128)
+        Args:
+            sources: Optional per-variable views into the mapped file, used
+                as-is for ``copy=False``. If omitted, ``data`` entries are views
+                of the already filled matrix columns.
+        """
+        self._columns = {}
+        self.data = {}
+        for i, name in enumerate(self.variables):
+            if name in self.data:
+                continue
+            self._columns[name] = i
+            if sources is not None:
+                # Zero-copy view into the mapped file
+                self.data[name] = sources[i]
+            elif i == 0 and self._is_complex:
+                # The independent variable of complex runs is real-valued
+                self.data[name] = self._matrix[:, i].real
             else:
-                self.data[var_name] = np.zeros(self._num_points, dtype=np.float64)
-
-        # Parse points
-        offset = 0
-        for point_idx in range(self._num_points):
-            if offset + point_size > len(data):
-                break
-
-            for var_idx, var_name in enumerate(self.variables):
-                if var_idx == 0 or not self._is_complex:
-                    # Double precision
-                    if offset + 8 <= len(data):
-                        value = struct.unpack_from("<d", data, offset)[0]
-                        self.data[var_name][point_idx] = value
-                        offset += 8
-                else:
-                    # Complex (two doubles: real, imag)
-                    if offset + 16 <= len(data):
-                        real = struct.unpack_from("<d", data, offset)[0]
-                        imag = struct.unpack_from("<d", data, offset + 8)[0]
-                        self.data[var_name][point_idx] = complex(real, imag)
-                        offset += 16
+                self.data[name] = self._matrix[:, i]
+
+    @property
+    def matrix(self) -> npt.NDArray[Any]:
+        """All variables as a 2D array with one column per variable.
+
+        Columns follow the order of ``variables``. When loaded with
+        ``copy=False`` a new array is assembled from the file on each access.
+        """
+        if not self._copy and self.data:
+            matrix = self._empty_matrix()
+            for name, index in self._columns.items():
+                matrix[:, index] = self.data[name]
+            return matrix
+        return self._matrix
 
     def get_frequency(self) -> npt.NDArray[Any]:
         """Get frequency values for AC analysis.
@@ -225,16 +442,14 @@ class SimulationResults:
         Raises:
             ValueError: If not an AC analysis or no frequency data.
         """
-        # Look for frequency variable
-        for name in ["frequency", "freq", "Frequency"]:
-            if name in self.data:
-                return np.asarray(np.abs(self.data[name]))  # Frequency might be stored as complex
-
-        # First variable is often the independent variable
-        if self.variables and self.variables[0].lower() in ["frequency", "freq"]:
-            return np.asarray(np.abs(self.data[self.variables[0]]))
-
-        raise ValueError("No frequency data found in results")
+        if self._frequency is None:
+            name = self._lookup.get("frequency") or self._lookup.get("freq")
+            if name is None:
+                raise ValueError("No frequency data found in results")
+            # Frequency is decoded as real float64; only take the real part
+            # (a view, not a copy) if a complex column is ever encountered
+            self._frequency = _real(self.data[name])
+        return self._frequency
 
     def get_time(self) -> npt.NDArray[Any]:
         """Get time values for transient analysis.
@@ -245,21 +460,46 @@ class SimulationResults:
         Raises:
             ValueError: If not a transient analysis or no time data.
         """
-        for name in ["time", "Time"]:
-            if name in self.data:
-                return self.data[name].real if np.iscomplexobj(self.data[name]) else self.data[name]
-
-        if self.variables and self.variables[0].lower() == "time":
-            arr = self.data[self.variables[0]]
-            return arr.real if np.iscomplexobj(arr) else arr
-
-        raise ValueError("No time data found in results")
-
-    def get_voltage(self, node: str) -> npt.NDArray[Any]:
+        if self._time is None:
+            name = self._lookup.get("time")
+            if name is None:
+                raise ValueError("No time data found in results")
+            self._time = _real(self.data[name])
+        return self._time
+
+    def _magnitude(self, name: str, points: slice = _ALL_POINTS) -> npt.NDArray[Any]:
+        """Get the magnitude of a variable over a range of points.
+
+        The magnitude of the full range of complex data is computed once and
+        cached; sub-ranges only compute the requested points.
+        """
+        whole = points == _ALL_POINTS
+        magnitude = self._magnitudes.get(name)
+        if magnitude is not None:
+            return magnitude if whole else magnitude[points]
+
+        values = self.data[name]
+        if not np.iscomplexobj(values):
+            return values if whole else values[points]
+        if whole:
+            magnitude = self._magnitudes[name] = np.asarray(np.abs(values))
+            return magnitude
+        return np.asarray(np.abs(values[points]))
+
+    def _find_voltage(self, node: str) -> str | None:
+        """Resolve a node name to its voltage variable name (case-insensitive)."""
+        key = node.lower()
+        return self._lookup.get(f"v({key})") or self._lookup.get(key)
+
+    def get_voltage(
+        self, node: str, start: int | None = None, stop: int | None = None
+    ) -> npt.NDArray[Any]:
         """Get voltage magnitude at a node.
 
         Args:
             node: Node name (e.g., 'out', 'in').
+            start: Index of the first point to return (default: first point).
+            stop: Index one past the last point to return (default: all points).
 
         Returns:
             Numpy array of voltage magnitudes.
@@ -267,29 +507,21 @@ class SimulationResults:
         Raises:
             KeyError: If node not found.
         """
-        # Try various naming conventions
-        candidates = [
-            f"V({node})",
-            f"v({node})",
-            f"V({node.lower()})",
-            f"V({node.upper()})",
-            node,
-        ]
-
-        for name in candidates:
-            if name in self.data:
-                values = self.data[name]
-                if np.iscomplexobj(values):
-                    return np.asarray(np.abs(values))
-                return values
+        name = self._find_voltage(node)
+        if name is not None:
+            return self._magnitude(name, slice(start, stop))
 
         raise KeyError(f"Voltage at node '{node}' not found. Available: {list(self.data.keys())}")
 
-    def get_phase(self, node: str) -> npt.NDArray[Any]:
+    def get_phase(
+        self, node: str, start: int | None = None, stop: int | None = None
+    ) -> npt.NDArray[Any]:
         """Get voltage phase at a node (in degrees).
 
         Args:
             node: Node name.
+            start: Index of the first point to return (default: first point).
+            stop: Index one past the last point to return (default: all points).
 
         Returns:
             Numpy array of phase values in degrees.
@@ -298,28 +530,32 @@ class SimulationResults:
             KeyError: If node not found.
             ValueError: If data is not complex.
         """
-        candidates = [
-            f"V({node})",
-            f"v({node})",
-            f"V({node.lower()})",
-            f"V({node.upper()})",
-            node,
-        ]
-
-        for name in candidates:
-            if name in self.data:
-                values = self.data[name]
-                if np.iscomplexobj(values):
-                    return np.asarray(np.angle(values, deg=True))
+        name = self._find_voltage(node)
+        if name is not None:
+            points = slice(start, stop)
+            whole = points == _ALL_POINTS
+            phase = self._phases.get(name)
+            if phase is not None:
+                return phase if whole else phase[points]
+            values = self.data[name]
+            if not np.iscomplexobj(values):
                 raise ValueError(f"Data for '{node}' is not complex, no phase available")
+            if not whole:
+                return np.asarray(np.angle(values[points], deg=True))
+            phase = self._phases[name] = np.asarray(np.angle(values, deg=True))
+            return phase
 
         raise KeyError(f"Voltage at node '{node}' not found")
 
-    def get_current(self, component: str) -> npt.NDArray[Any]:
+    def get_current(
+        self, component: str, start: int | None = None, stop: int | None = None
+    ) -> npt.NDArray[Any]:
         """Get current through a component.
 
         Args:
             component: Component name (e.g., 'R1', 'V1').
+            start: Index of the first point to return (default: first point).
+            stop: Index one past the last point to return (default: all points).
 
         Returns:
             Numpy array of current magnitudes.
@@ -327,24 +563,33 @@ class SimulationResults:
         Raises:
             KeyError: If component current not found.
         """
-        candidates = [
-            f"I({component})",
-            f"i({component})",
-            f"I({component.lower()})",
-            f"I({component.upper()})",
-            f"Ix({component}:+)",
-        ]
-
-        for name in candidates:
-            if name in self.data:
-                values = self.data[name]
-                if np.iscomplexobj(values):
-                    return np.asarray(np.abs(values))
-                return values
+        key = component.lower()
+        name = self._lookup.get(f"i({key})") or self._lookup.get(f"ix({key}:+)")
+        if name is not None:
+            return self._magnitude(name, slice(start, stop))
 
         available = list(self.data.keys())
         raise KeyError(f"Current through '{component}' not found. Available: {available}")
 
+    def nearest_index(self, node: str, magnitude: float) -> int:
+        """Find the point where the voltage magnitude at a node is closest to a value.
+
+        Useful for locating e.g. the -3dB point of a filter without building
+        intermediate dB arrays.
+
+        Args:
+            node: Node name.
+            magnitude: Target voltage magnitude.
+
+        Returns:
+            Index of the closest point.
+
+        Raises:
+            KeyError: If node not found.
+            ValueError: If there is no data for the node.
+        """
+        return int(np.argmin(np.abs(self.get_voltage(node) - magnitude)))
+
     def get_variable(self, name: str) -> npt.NDArray[Any]:
         """Get any variable by exact name.
 
@@ -1,11 +1,28 @@
 """Circuit builder for creating SPICE circuits."""
 
-from typing import Any
+import copy
+import functools
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, TextIO
 
 from ohmspice.components.base import Component
 from ohmspice.components.passive import Capacitor, Inductor, Resistor
 from ohmspice.components.sources import CurrentSource, VoltageSource
 
+# Component classes by SPICE name prefix, used by Circuit.add()
+_COMPONENT_TYPES: dict[str, type[Component]] = {
+    cls.PREFIX: cls for cls in (Resistor, Capacitor, Inductor, VoltageSource, CurrentSource)
+}
+
+# Component order in normalized netlists, by name prefix
+_NORMALIZED_ORDER = {prefix: i for i, prefix in enumerate("VIRCL")}
+
+# SPICE scale suffixes for analysis frequencies, largest first
+_FREQUENCY_SUFFIXES = ((1e12, "t"), (1e9, "g"), (1e6, "meg"), (1e3, "k"))
+# Compact like "g" (no trailing ".0") without rounding to 6 significant digits
+_FREQUENCY_FORMAT = ".12g"
+
 
 class Circuit:
     """A SPICE circuit builder.
@@ -42,7 +59,23 @@ class Circuit:
         self.name = name
         self.components: list[Component] = []
         self.analyses: list[str] = []
-        self._component_names: set[str] = set()
+        self._components_by_name: dict[str, Component] = {}
+
+    def reset(self, name: str | None = None) -> "Circuit":
+        """Remove all components and analyses so the circuit can be reused.
+
+        Args:
+            name: New circuit name; keeps the current name if omitted.
+
+        Returns:
+            Self for method chaining.
+        """
+        if name is not None:
+            self.name = name
+        self.components.clear()
+        self.analyses.clear()
+        self._components_by_name.clear()
+        return self
 
     def _add_component(self, component: Component) -> "Circuit":
         """Add a component to the circuit.
@@ -56,11 +89,95 @@ class Circuit:
         Raises:
             ValueError: If a component with the same name already exists.
         """
-        if component.name in self._component_names:
+        # One hash lookup both checks for a duplicate and registers the name
+        if self._components_by_name.setdefault(component.name, component) is not component:
             raise ValueError(f"Component '{component.name}' already exists in circuit")
 
         self.components.append(component)
-        self._component_names.add(component.name)
+        return self
+
+    def copy(self) -> "Circuit":
+        """Return an independent copy of the circuit.
+
+        Components are copied, so modifying the copy leaves this circuit
+        unchanged.
+
+        Returns:
+            The new circuit.
+        """
+        clone = Circuit(self.name)
+        clone.components = [copy.copy(component) for component in self.components]
+        clone._components_by_name = {component.name: component for component in clone.components}
+        clone.analyses = self.analyses.copy()
+        return clone
+
+    def get_component(self, name: str) -> Component:
+        """Get a component by name.
+
+        Args:
+            name: Component name (e.g., 'R1').
+
+        Returns:
+            The component with that name.
+
+        Raises:
+            KeyError: If no component has that name.
+        """
+        try:
+            return self._components_by_name[name]
+        except KeyError:
+            raise KeyError(f"Component '{name}' not found in circuit") from None
+
+    def add(self, name: str, node1: str, node2: str, *args: Any, **kwargs: Any) -> "Circuit":
+        """Add a component whose type is given by its name prefix.
+
+        Remaining arguments are passed to the component class, so
+        ``add("R1", "in", "out", "1k")`` is equivalent to
+        ``add_resistor("R1", "in", "out", "1k")`` and
+        ``add("V1", "in", "0", ac=1)`` to ``add_voltage_source("V1", "in", "0", ac=1)``.
+
+        Args:
+            name: Component name; the first letter selects the type (R, C, L, V, I).
+            node1: First (or positive) node.
+            node2: Second (or negative) node.
+            *args: Positional arguments for the component class (e.g., value).
+            **kwargs: Keyword arguments for the component class.
+
+        Returns:
+            Self for method chaining.
+
+        Raises:
+            ValueError: If the name prefix is not a supported component type.
+        """
+        component_type = _COMPONENT_TYPES.get(name[:1].upper())
+        if component_type is None:
+            raise ValueError(f"Unknown component type for name '{name}'")
+        return self._add_component(component_type(name, node1, node2, *args, **kwargs))
+
+    def add_components(self, specs: Iterable[tuple[Any, ...]]) -> "Circuit":
+        """Add several components in one call.
+
+        Each spec holds the positional arguments of add(), so
+        ``add_components([("R1", "in", "out", "1k"), ("C1", "out", "0", "1u")])``
+        adds a resistor and a capacitor.
+
+        Args:
+            specs: Tuples of (name, node1, node2, *args).
+
+        Returns:
+            Self for method chaining.
+
+        Raises:
+            ValueError: If a name prefix is not a supported component type or
+                a component with the same name already exists.
+        """
+        component_types = _COMPONENT_TYPES
+        add_component = self._add_component
+        for name, node1, node2, *args in specs:
+            component_type = component_types.get(name[:1].upper())
+            if component_type is None:
+                raise ValueError(f"Unknown component type for name '{name}'")
+            add_component(component_type(name, node1, node2, *args))
         return self
 
     def add_resistor(
@@ -218,11 +335,29 @@ class Circuit:
         Returns:
             Self for method chaining.
         """
-        # Format frequencies
-        start_str = self._format_frequency(start)
-        stop_str = self._format_frequency(stop)
+        self.analyses.append(_format_ac(variation, points_per_decade, start, stop))
+        return self
+
+    def add_ac_analysis_decade(
+        self,
+        center: float,
+        decades: int = 1,
+        points_per_decade: int = 10,
+    ) -> "Circuit":
+        """Add a logarithmic AC analysis centered on a frequency.
+
+        The sweep runs from ``center / 10**decades`` to ``center * 10**decades``.
 
-        self.analyses.append(f".ac {variation} {points_per_decade} {start_str} {stop_str}")
+        Args:
+            center: Center frequency in Hz.
+            decades: Number of decades on each side of the center.
+            points_per_decade: Number of points per decade.
+
+        Returns:
+            Self for method chaining.
+        """
+        span = 10**decades
+        self.analyses.append(_format_ac("dec", points_per_decade, center / span, center * span))
         return self
 
     def add_dc_analysis(
@@ -278,48 +413,87 @@ class Circuit:
         return self
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _format_frequency(freq: float) -> str:
         """Format frequency for SPICE (e.g., 1e6 -> 1meg)."""
-        if freq >= 1e12:
-            return f"{freq / 1e12}t"
-        elif freq >= 1e9:
-            return f"{freq / 1e9}g"
-        elif freq >= 1e6:
-            return f"{freq / 1e6}meg"
-        elif freq >= 1e3:
-            return f"{freq / 1e3}k"
-        else:
-            return str(freq)
+        for scale, suffix in _FREQUENCY_SUFFIXES:
+            if freq >= scale:
+                return "".join((format(freq / scale, _FREQUENCY_FORMAT), suffix))
+        return format(freq, _FREQUENCY_FORMAT)
 
-    def to_netlist(self) -> str:
+    def _iter_lines(self, normalized: bool = False) -> Iterator[str]:
+        """Yield the netlist one line at a time."""
+        yield f"* {self.name}"
+
+        # Add all components
+        components = self._normalized_components() if normalized else self.components
+        for component in components:
+            yield component.to_spice()
+
+        # Add analysis commands
+        yield from self.analyses
+
+        # End statement
+        yield ".end"
+
+    def _normalized_components(self) -> list[Component]:
+        """Return copies of the components in canonical order with renumbered nets.
+
+        Components are sorted by type (V, I, R, C, L, then others) and name.
+        Nets other than ground are renamed n1, n2, ... in order of first use.
+        """
+        ordered = sorted(
+            self.components,
+            key=lambda c: (
+                _NORMALIZED_ORDER.get(c.name[:1].upper(), len(_NORMALIZED_ORDER)),
+                c.name,
+            ),
+        )
+        nets = {"0": "0"}
+        normalized = []
+        for component in ordered:
+            clone = copy.copy(component)
+            clone.node1 = nets.setdefault(component.node1, f"n{len(nets)}")
+            clone.node2 = nets.setdefault(component.node2, f"n{len(nets)}")
+            normalized.append(clone)
+        return normalized
+
+    def to_netlist(self, normalized: bool = False) -> str:
         """Generate SPICE netlist string.
 
+        Args:
+            normalized: Emit components in canonical order (by type, then
+                name) with nets renumbered n1, n2, ..., so structurally
+                identical circuits produce identical netlists apart from the
+                title line. Intended for hashing and diffing; node names in
+                simulation results will not match the original circuit.
+
         Returns:
             Complete SPICE netlist as a string.
         """
-        lines = [f"* {self.name}"]
+        return "\n".join(self._iter_lines(normalized))
 
-        # Add all components
-        for component in self.components:
-            lines.append(component.to_spice())
+    def write(self, fp: TextIO) -> None:
+        """Stream the netlist to an open text file.
 
-        # Add analysis commands
-        for analysis in self.analyses:
-            lines.append(analysis)
+        Unlike to_netlist(), the full netlist string is never built in memory.
 
-        # End statement
-        lines.append(".end")
-
-        return "\n".join(lines)
+        Args:
+            fp: Writable text file object.
+        """
+        fp.writelines(f"{line}\n" for line in self._iter_lines())
 
-    def save(self, filepath: str) -> None:
+    def save(self, filepath: str | Path) -> None:
         """Save netlist to a file.
 
+        Lines are streamed through write(), so the full netlist string is
+        never built, and end with the platform's line separator.
+
         Args:
             filepath: Path to save the netlist file.
         """
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(self.to_netlist())
+        with open(filepath, "w", encoding="utf-8", buffering=1 << 16) as f:
+            self.write(f)
 
     def __repr__(self) -> str:
         """Return string representation."""
@@ -328,3 +502,10 @@ class Circuit:
     def __len__(self) -> int:
         """Return number of components."""
         return len(self.components)
+
+
+def _format_ac(variation: str, points_per_decade: int, start: float, stop: float) -> str:
+    """Format an AC analysis line."""
+    start_str = Circuit._format_frequency(start)
+    stop_str = Circuit._format_frequency(stop)
+    return " ".join((".ac", variation, str(points_per_decade), start_str, stop_str))
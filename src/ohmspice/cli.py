@@ -15,54 +15,83 @@ Example:
     $ ohmspice simulate filter.cir --analysis ac --plot
 """
 
+import functools
+import importlib
+import os
+import re
 import sys
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import click
 
 from ohmspice import __version__
-from ohmspice.components.utils import parse_value
 
+# Template categories: display title and the module that defines them. Modules
+# are imported only when a command needs that category.
+_TEMPLATE_CATEGORIES = {
+    "filters": ("Filters", "ohmspice.templates.filters"),
+    "amplifiers": ("Amplifiers", "ohmspice.templates.amplifiers"),
+    "oscillators": ("Oscillators", "ohmspice.templates.oscillators"),
+    "power": ("Power", "ohmspice.templates.power"),
+}
+
+
+def _banner(title: str) -> str:
+    """Build a boxed, styled banner."""
+    return "\n".join(
+        [
+            click.style("╔════════════════════════════════════════╗", fg="cyan"),
+            click.style(title, fg="cyan", bold=True),
+            click.style("╚════════════════════════════════════════╝", fg="cyan"),
+        ]
+    )
 
-# Template registry - lazy loaded
-def _get_all_templates() -> dict[str, Any]:
-    """Get all available templates from all categories."""
-    from ohmspice.templates import amplifiers, filters, oscillators, power
 
-    all_templates: dict[str, Any] = {}
+# Constant styled strings, built once at import
+_TEMPLATES_BANNER = "\n" + _banner("║     OhmSPICE Circuit Templates         ║")
+_INTERACTIVE_BANNER = "\n" + _banner("║   OhmSPICE Interactive Mode            ║")
+_NETLIST_HEADER = click.style("\n─── Netlist ───", fg="cyan")
+_PROMPT = click.style("ohmspice> ", fg="cyan", bold=True)
+_SIMULATE_HINT = click.style("Simulation requires saving first.", fg="yellow")
 
-    # Filters
-    for name, template in filters.FILTER_TEMPLATES.items():
-        all_templates[name] = template
+# 'dc=<number>' / 'ac=<number>' arguments of the interactive 'add vsource' command
+_SOURCE_VALUE_RE = re.compile(r"^(dc|ac)=([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)$")
 
-    # Amplifiers
-    for name, template in amplifiers.AMPLIFIER_TEMPLATES.items():
-        all_templates[name] = template
+# Short names accepted by 'ohmspice new'
+_TEMPLATE_ALIASES = {
+    "lowpass": "rc_lowpass",
+    "highpass": "rc_highpass",
+    "bandpass": "rlc_bandpass",
+    "notch": "rlc_notch",
+}
+
+
+# Template registry - lazy loaded
+@functools.lru_cache(maxsize=1)
+def _get_all_templates() -> Mapping[str, Any]:
+    """Get all available templates from all categories, keyed by name and alias."""
+    from ohmspice.templates import amplifiers, filters, oscillators, power
 
-    # Oscillators
-    for name, template in oscillators.OSCILLATOR_TEMPLATES.items():
-        all_templates[name] = template
+    all_templates: dict[str, Any] = {
+        **filters.FILTER_TEMPLATES,
+        **amplifiers.AMPLIFIER_TEMPLATES,
+        **oscillators.OSCILLATOR_TEMPLATES,
+        **power.POWER_TEMPLATES,
+    }
 
-    # Power
-    for name, template in power.POWER_TEMPLATES.items():
-        all_templates[name] = template
+    # Aliases resolve once here instead of on every lookup
+    for alias, name in _TEMPLATE_ALIASES.items():
+        all_templates[alias] = all_templates[name]
 
-    return all_templates
+    return MappingProxyType(all_templates)
 
 
 def _get_template_by_name(name: str) -> Any:
     """Get a template by name."""
-    templates = _get_all_templates()
-    # Handle aliases
-    aliases = {
-        "lowpass": "rc_lowpass",
-        "highpass": "rc_highpass",
-        "bandpass": "rlc_bandpass",
-        "notch": "rlc_notch",
-    }
-    name = aliases.get(name.lower(), name.lower())
-    return templates.get(name)
+    return _get_all_templates().get(name.lower())
 
 
 @click.group()
@@ -80,30 +109,20 @@ def main() -> None:
 @click.option(
     "--category",
     "-c",
-    type=click.Choice(["filters", "amplifiers", "oscillators", "power", "all"]),
+    type=click.Choice([*_TEMPLATE_CATEGORIES, "all"]),
     default="all",
     help="Filter templates by category",
 )
 @click.option("--verbose", "-v", is_flag=True, help="Show detailed info")
 def list_templates(category: str, verbose: bool) -> None:
     """List available circuit templates."""
-    from ohmspice.templates import amplifiers, filters, oscillators, power
-
-    categories = {
-        "filters": ("Filters", filters.list_templates()),
-        "amplifiers": ("Amplifiers", amplifiers.list_templates()),
-        "oscillators": ("Oscillators", oscillators.list_templates()),
-        "power": ("Power", power.list_templates()),
-    }
+    cats_to_show = list(_TEMPLATE_CATEGORIES) if category == "all" else [category]
 
-    cats_to_show = list(categories.keys()) if category == "all" else [category]
-
-    click.echo("\n" + click.style("╔════════════════════════════════════════╗", fg="cyan"))
-    click.echo(click.style("║     OhmSPICE Circuit Templates         ║", fg="cyan", bold=True))
-    click.echo(click.style("╚════════════════════════════════════════╝", fg="cyan"))
+    click.echo(_TEMPLATES_BANNER)
 
     for cat in cats_to_show:
-        title, templates = categories[cat]
+        title, module_name = _TEMPLATE_CATEGORIES[cat]
+        templates = importlib.import_module(module_name).list_templates()
         click.echo(f"\n{click.style(f'📁 {title}', fg='yellow', bold=True)}")
         click.echo("─" * 40)
 
@@ -162,6 +181,8 @@ def new_circuit(
 
         ohmspice new voltage_divider --vout 3.3 --vin 5 -o divider.cir
     """
+    from ohmspice.components.utils import parse_value
+
     tmpl = _get_template_by_name(template)
     if tmpl is None:
         click.echo(click.style(f"Error: Template '{template}' not found.", fg="red"))
@@ -212,15 +233,13 @@ def new_circuit(
         click.echo(f"Details: {e}")
         sys.exit(1)
 
-    netlist = circuit.to_netlist()
-
     if output:
         output_path = Path(output)
         circuit.save(str(output_path))
         click.echo(click.style(f"✓ Created: {output_path}", fg="green"))
     else:
         click.echo(click.style("\n─── Generated Netlist ───", fg="cyan"))
-        click.echo(netlist)
+        click.echo(circuit.to_netlist())
 
     if simulate:
         click.echo(click.style("\n🔧 Running simulation...", fg="yellow"))
@@ -231,14 +250,8 @@ def new_circuit(
             if output:
                 sim.run_netlist(str(output_path))
             else:
-                # Save to temp file
-                import tempfile
-
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".cir", delete=False) as f:
-                    f.write(netlist)
-                    temp_path = f.name
-                sim.run_netlist(temp_path)
-                Path(temp_path).unlink()
+                # Streams the netlist to a temp file and cleans up after itself
+                sim.run(circuit)
 
             click.echo(click.style("✓ Simulation completed!", fg="green"))
         except ImportError:
@@ -265,15 +278,13 @@ def simulate_circuit(file: str, analysis: str | None, plot: bool, output: str |
 
         ohmspice simulate circuit.net -a ac -o results.csv
     """
-    file_path = Path(file)
-
     try:
         from ohmspice.simulators import LTSpice
 
-        click.echo(click.style(f"🔧 Simulating: {file_path.name}", fg="yellow"))
+        click.echo(click.style(f"🔧 Simulating: {os.path.basename(file)}", fg="yellow"))
 
         sim = LTSpice()
-        results = sim.run_netlist(str(file_path))
+        results = sim.run_netlist(file)
 
         click.echo(click.style("✓ Simulation completed!", fg="green"))
 
@@ -352,9 +363,7 @@ def interactive_mode() -> None:
         help
         exit
     """
-    click.echo(click.style("\n╔════════════════════════════════════════╗", fg="cyan"))
-    click.echo(click.style("║   OhmSPICE Interactive Mode            ║", fg="cyan", bold=True))
-    click.echo(click.style("╚════════════════════════════════════════╝", fg="cyan"))
+    click.echo(_INTERACTIVE_BANNER)
     click.echo("Type 'help' for commands, 'exit' to quit.\n")
 
     from ohmspice import Circuit
@@ -401,14 +410,16 @@ Commands:
                 circuit.add_inductor(name, n1, n2, value)
             elif comp_type in ("vsource", "voltage"):
                 # Parse dc/ac values
-                dc_val = None
-                ac_val = None
+                source_values: dict[str, float] = {}
                 for arg in args[4:]:
-                    if arg.startswith("dc="):
-                        dc_val = float(arg[3:])
-                    elif arg.startswith("ac="):
-                        ac_val = float(arg[3:])
-                circuit.add_voltage_source(name, n1, n2, dc=dc_val, ac=ac_val)
+                    match = _SOURCE_VALUE_RE.match(arg)
+                    if match:
+                        source_values[match.group(1)] = float(match.group(2))
+                    elif arg.startswith(("dc=", "ac=")):
+                        raise ValueError(f"Invalid source value: {arg}")
+                circuit.add_voltage_source(
+                    name, n1, n2, dc=source_values.get("dc"), ac=source_values.get("ac")
+                )
             else:
                 click.echo(click.style(f"Unknown component type: {comp_type}", fg="red"))
                 return
@@ -450,11 +461,66 @@ Commands:
         except Exception as e:
             click.echo(click.style(f"Error: {e}", fg="red"))
 
+    def quit_mode(args: list[str]) -> bool:
+        click.echo("Goodbye!")
+        return True
+
+    def new_circuit_cmd(args: list[str]) -> None:
+        nonlocal circuit, circuit_name
+        circuit_name = " ".join(args) if args else "Interactive Circuit"
+        circuit = Circuit(circuit_name)
+        click.echo(click.style(f"✓ Created circuit: {circuit_name}", fg="green"))
+
+    def show_netlist(args: list[str]) -> None:
+        if circuit:
+            click.echo(_NETLIST_HEADER)
+            click.echo(circuit.to_netlist())
+        else:
+            click.echo("No circuit created. Use 'new' first.")
+
+    def save_netlist(args: list[str]) -> None:
+        if circuit and args:
+            circuit.save(args[0])
+            click.echo(click.style(f"✓ Saved to: {args[0]}", fg="green"))
+        else:
+            click.echo("Usage: save <filename>")
+
+    def clear_circuit(args: list[str]) -> None:
+        nonlocal circuit
+        circuit = None
+        click.echo("Circuit cleared.")
+
+    def simulate_circuit_cmd(args: list[str]) -> None:
+        click.echo(_SIMULATE_HINT)
+
+    # Scripted input (pipes, files) skips click's per-line prompt handling
+    is_tty = sys.stdin.isatty()
+
+    def read_command() -> str:
+        if is_tty:
+            return click.prompt(_PROMPT, prompt_suffix="", default="", show_default=False)
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line
+
+    # Command dispatch table; a handler returning True ends the session
+    handlers: dict[str, Callable[[list[str]], bool | None]] = {
+        "exit": quit_mode,
+        "quit": quit_mode,
+        "help": lambda args: show_help(),
+        "new": new_circuit_cmd,
+        "add": parse_add,
+        "analysis": parse_analysis,
+        "show": show_netlist,
+        "save": save_netlist,
+        "clear": clear_circuit,
+        "simulate": simulate_circuit_cmd,
+    }
+
     while True:
         try:
-            prompt = click.style("ohmspice> ", fg="cyan", bold=True)
-            line = click.prompt(prompt, prompt_suffix="", default="", show_default=False)
-            line = line.strip()
+            line = read_command().strip()
 
             if not line:
                 continue
@@ -463,39 +529,12 @@ Commands:
             cmd = parts[0].lower()
             args = parts[1:]
 
-            if cmd == "exit" or cmd == "quit":
-                click.echo("Goodbye!")
-                break
-            elif cmd == "help":
-                show_help()
-            elif cmd == "new":
-                circuit_name = " ".join(args) if args else "Interactive Circuit"
-                circuit = Circuit(circuit_name)
-                click.echo(click.style(f"✓ Created circuit: {circuit_name}", fg="green"))
-            elif cmd == "add":
-                parse_add(args)
-            elif cmd == "analysis":
-                parse_analysis(args)
-            elif cmd == "show":
-                if circuit:
-                    click.echo(click.style("\n─── Netlist ───", fg="cyan"))
-                    click.echo(circuit.to_netlist())
-                else:
-                    click.echo("No circuit created. Use 'new' first.")
-            elif cmd == "save":
-                if circuit and args:
-                    circuit.save(args[0])
-                    click.echo(click.style(f"✓ Saved to: {args[0]}", fg="green"))
-                else:
-                    click.echo("Usage: save <filename>")
-            elif cmd == "clear":
-                circuit = None
-                click.echo("Circuit cleared.")
-            elif cmd == "simulate":
-                click.echo(click.style("Simulation requires saving first.", fg="yellow"))
-            else:
+            handler = handlers.get(cmd)
+            if handler is None:
                 click.echo(click.style(f"Unknown command: {cmd}", fg="red"))
                 click.echo("Type 'help' for available commands.")
+            elif handler(args):
+                break
 
         except (KeyboardInterrupt, EOFError):
             click.echo("\nGoodbye!")
@@ -5,7 +5,7 @@ This package provides SPICE component classes for building circuits.
 
 from ohmspice.components.base import Component
 from ohmspice.components.passive import Capacitor, Inductor, Resistor
-from ohmspice.components.sources import CurrentSource, VoltageSource
+from ohmspice.components.sources import CurrentSource, PulseParams, SineParams, VoltageSource
 from ohmspice.components.utils import format_value, parse_value
 
 __all__ = [
@@ -15,6 +15,8 @@ __all__ = [
     "Inductor",
     "VoltageSource",
     "CurrentSource",
+    "PulseParams",
+    "SineParams",
     "parse_value",
     "format_value",
 ]
@@ -1,9 +1,66 @@
 """Base component class for SPICE circuits."""
 
+import functools
+import operator
+import sys
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
 
 from ohmspice.components.utils import parse_value
 
+# Conventional node names that are already normalized, mapped to their
+# interned form so the common case skips _normalize_node entirely
+_COMMON_NODES: dict[str, str] = {
+    node: sys.intern(node) for node in ("0", "in", "out", "vcc", "vdd", "vss", "n1", "n2", "n3")
+}
+
+_T = TypeVar("_T")
+_TwoTerminalT = TypeVar("_TwoTerminalT", bound="TwoTerminalComponent")
+
+
+class _SpiceAttribute(property, Generic[_T]):
+    """Property stored in a slot that clears the cached netlist line when set.
+
+    Reads go through a C-level attrgetter. Construction writes the backing
+    slot directly, so only later reassignment pays for the setter.
+    """
+
+    def __init__(self, slot: str, doc: str) -> None:
+        """Create the property.
+
+        Args:
+            slot: Name of the backing slot.
+            doc: Property docstring.
+        """
+
+        def fset(component: "Component", value: _T) -> None:
+            setattr(component, slot, value)
+            component._spice_cache = None
+
+        super().__init__(operator.attrgetter(slot), fset, None, doc)
+        self.__doc__ = doc
+
+    if TYPE_CHECKING:
+        # Typed accessors; at runtime the C implementations of property are used
+
+        @overload
+        def __get__(self, obj: None, owner: type | None = None) -> "_SpiceAttribute[_T]": ...
+        @overload
+        def __get__(self, obj: object, owner: type | None = None) -> _T: ...
+        def __get__(self, obj: object, owner: type | None = None) -> Any: ...
+        def __set__(self, obj: object, value: _T) -> None: ...
+
+
+@functools.cache
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """Return every slot declared by a class and its bases."""
+    return tuple(name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ()))
+
+
+def _build_spice_unused(self: "Component") -> str:
+    """Stand-in _build_spice() for components that override to_spice()."""
+    raise NotImplementedError(f"{type(self).__name__} overrides to_spice() instead")
+
 
 class Component(ABC):
     """Abstract base class for all SPICE components.
@@ -11,12 +68,27 @@ class Component(ABC):
     All components have a name and connect to nodes. The specific
     behavior and netlist format depends on the component type.
 
+    Subclasses implement either to_spice() or _build_spice(); one that
+    implements neither cannot be instantiated. The result of
+    _build_spice() is cached by to_spice() until an attribute that appears in
+    the netlist line is reassigned; subclasses that add such attributes
+    declare them with _SpiceAttribute or clear ``_spice_cache`` themselves.
+
     Attributes:
         name: Component identifier (e.g., 'R1', 'C1', 'V1').
         node1: First connection node.
         node2: Second connection node.
     """
 
+    __slots__ = ("_spice_cache", "_name", "_node1", "_node2")
+
+    name: _SpiceAttribute[str] = _SpiceAttribute("_name", "Component identifier.")
+    node1: _SpiceAttribute[str] = _SpiceAttribute("_node1", "First connection node.")
+    node2: _SpiceAttribute[str] = _SpiceAttribute("_node2", "Second connection node.")
+
+    #: Component prefix letter (R, C, L, V, I, etc.); empty disables the check
+    PREFIX: str = ""
+
     def __init__(self, name: str, node1: str, node2: str) -> None:
         """Initialize a component.
 
@@ -27,24 +99,34 @@ class Component(ABC):
             node2: Second connection node name.
 
         Raises:
-            ValueError: If name is empty or nodes are invalid.
+            ValueError: If name is empty, doesn't start with the component
+                prefix, or nodes are invalid.
         """
         if not name:
             raise ValueError("Component name cannot be empty")
+        if self.PREFIX and name[:1].upper() != self.PREFIX:
+            raise ValueError(
+                f"{self.__class__.__name__} name must start with '{self.PREFIX}', got '{name}'"
+            )
         if not node1:
             raise ValueError("Node1 cannot be empty")
         if not node2:
             raise ValueError("Node2 cannot be empty")
 
-        self.name = name
-        self.node1 = self._normalize_node(node1)
-        self.node2 = self._normalize_node(node2)
+        self._spice_cache: str | None = None
+        # Interned so lookups in Circuit's name index can match by identity
+        self._name = sys.intern(name)
+        self._node1 = _COMMON_NODES.get(node1) or self._normalize_node(node1)
+        self._node2 = _COMMON_NODES.get(node2) or self._normalize_node(node2)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _normalize_node(node: str) -> str:
         """Normalize node name.
 
-        Converts 'gnd' and 'GND' to '0' for SPICE compatibility.
+        Converts 'gnd' and 'GND' to '0' for SPICE compatibility. Node names
+        are interned, so components sharing a net share one string object.
+        Results are memoized since circuits reuse a small set of node names.
 
         Args:
             node: Node name to normalize.
@@ -54,17 +136,51 @@ class Component(ABC):
         """
         if node.lower() == "gnd":
             return "0"
-        return node
+        return sys.intern(node)
+
+    def __copy__(self) -> "Component":
+        """Return a shallow copy, sharing the cached netlist line.
+
+        Copies slots directly, which is several times faster than the
+        generic copy protocol for slotted classes. Attributes of subclasses
+        without ``__slots__`` are copied from the instance ``__dict__``.
+        """
+        clone = object.__new__(type(self))
+        set_attr = object.__setattr__
+        for name in _slot_names(type(self)):
+            set_attr(clone, name, getattr(self, name))
+        state = getattr(self, "__dict__", None)
+        if state:
+            clone.__dict__.update(state)
+        return clone
 
-    @abstractmethod
     def to_spice(self) -> str:
         """Generate SPICE netlist line for this component.
 
+        Returns:
+            SPICE netlist format string for this component.
+        """
+        if self._spice_cache is None:
+            self._spice_cache = self._build_spice()
+        return self._spice_cache
+
+    @abstractmethod
+    def _build_spice(self) -> str:
+        """Build the SPICE netlist line for this component.
+
         Returns:
             SPICE netlist format string for this component.
         """
         pass
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Make _build_spice() optional for subclasses that override to_spice()."""
+        super().__init_subclass__(**kwargs)
+        # ABCMeta collects abstract methods after this hook runs, so a
+        # concrete stand-in keeps such subclasses instantiable
+        if "to_spice" in cls.__dict__ and getattr(cls._build_spice, "__isabstractmethod__", False):
+            cls._build_spice = _build_spice_unused  # type: ignore[method-assign]
+
     def __repr__(self) -> str:
         """Return string representation of component."""
         return f"{self.__class__.__name__}({self.name!r}, {self.node1!r}, {self.node2!r})"
@@ -80,8 +196,12 @@ class TwoTerminalComponent(Component):
         value_str: Original value string for netlist output.
     """
 
-    #: Component prefix letter (R, C, L, etc.)
-    PREFIX: str = ""
+    __slots__ = ("_value_str", "value")
+
+    value_str: _SpiceAttribute[str] = _SpiceAttribute(
+        "_value_str", "Original value string for netlist output."
+    )
+
     #: Component unit (Ω, F, H, etc.)
     UNIT: str = ""
 
@@ -106,20 +226,50 @@ class TwoTerminalComponent(Component):
         """
         super().__init__(name, node1, node2)
 
-        # Validate name prefix
-        if self.PREFIX and not name.upper().startswith(self.PREFIX):
-            raise ValueError(
-                f"{self.__class__.__name__} name must start with '{self.PREFIX}', got '{name}'"
-            )
-
         # Store original string for netlist output
-        self.value_str = str(value) if isinstance(value, (int, float)) else value
+        self._value_str = str(value) if isinstance(value, (int, float)) else value
 
         # Parse value to float for calculations
         self.value = parse_value(value)
 
-    def to_spice(self) -> str:
-        """Generate SPICE netlist line.
+    @classmethod
+    def unchecked(
+        cls: type[_TwoTerminalT],
+        name: str,
+        node1: str,
+        node2: str,
+        value: float,
+        value_str: str | None = None,
+    ) -> _TwoTerminalT:
+        """Create a component without validating or parsing its arguments.
+
+        A fast path for generated circuits (sweeps, parametric netlists)
+        built in a loop. Nothing is checked: the name prefix is not
+        verified, nodes are used as given (pass '0', not 'gnd'), and an
+        invalid value produces an invalid netlist rather than an error.
+
+        Args:
+            name: Component identifier.
+            node1: First connection node, already normalized.
+            node2: Second connection node, already normalized.
+            value: Component value as a number.
+            value_str: Netlist value string. Defaults to ``repr(value)``.
+
+        Returns:
+            The new component.
+        """
+        self = cls.__new__(cls)
+        set_attr = object.__setattr__
+        set_attr(self, "_spice_cache", None)
+        set_attr(self, "_name", name)
+        set_attr(self, "_node1", node1)
+        set_attr(self, "_node2", node2)
+        set_attr(self, "value", value)
+        set_attr(self, "_value_str", repr(value) if value_str is None else value_str)
+        return self
+
+    def _build_spice(self) -> str:
+        """Build SPICE netlist line.
 
         Returns:
             SPICE netlist format: NAME NODE1 NODE2 VALUE
@@ -1,6 +1,6 @@
 """Passive components: Resistor, Capacitor, Inductor."""
 
-from ohmspice.components.base import TwoTerminalComponent
+from ohmspice.components.base import TwoTerminalComponent, _SpiceAttribute
 
 
 class Resistor(TwoTerminalComponent):
@@ -16,6 +16,8 @@ class Resistor(TwoTerminalComponent):
         1000.0
     """
 
+    __slots__ = ()
+
     PREFIX = "R"
     UNIT = "Ω"
 
@@ -51,6 +53,12 @@ class Capacitor(TwoTerminalComponent):
         1e-07
     """
 
+    __slots__ = ("_initial_voltage",)
+
+    initial_voltage: _SpiceAttribute[float | None] = _SpiceAttribute(
+        "_initial_voltage", "Initial voltage for transient analysis."
+    )
+
     PREFIX = "C"
     UNIT = "F"
 
@@ -73,11 +81,30 @@ class Capacitor(TwoTerminalComponent):
             initial_voltage: Optional initial voltage for transient analysis.
         """
         super().__init__(name, node1, node2, value)
-        self.initial_voltage = initial_voltage
+        self._initial_voltage = initial_voltage
+
+    @classmethod
+    def unchecked(
+        cls,
+        name: str,
+        node1: str,
+        node2: str,
+        value: float,
+        value_str: str | None = None,
+        initial_voltage: float | None = None,
+    ) -> "Capacitor":
+        """Create a capacitor without validation.
+
+        See TwoTerminalComponent.unchecked(); initial_voltage is the
+        optional initial voltage for transient analysis.
+        """
+        self = super().unchecked(name, node1, node2, value, value_str)
+        object.__setattr__(self, "_initial_voltage", initial_voltage)
+        return self
 
-    def to_spice(self) -> str:
-        """Generate SPICE netlist line."""
-        base = super().to_spice()
+    def _build_spice(self) -> str:
+        """Build SPICE netlist line."""
+        base = super()._build_spice()
         if self.initial_voltage is not None:
             return f"{base} IC={self.initial_voltage}"
         return base
@@ -96,6 +123,12 @@ class Inductor(TwoTerminalComponent):
         0.01
     """
 
+    __slots__ = ("_initial_current",)
+
+    initial_current: _SpiceAttribute[float | None] = _SpiceAttribute(
+        "_initial_current", "Initial current for transient analysis."
+    )
+
     PREFIX = "L"
     UNIT = "H"
 
@@ -118,11 +151,30 @@ class Inductor(TwoTerminalComponent):
             initial_current: Optional initial current for transient analysis.
         """
         super().__init__(name, node1, node2, value)
-        self.initial_current = initial_current
+        self._initial_current = initial_current
+
+    @classmethod
+    def unchecked(
+        cls,
+        name: str,
+        node1: str,
+        node2: str,
+        value: float,
+        value_str: str | None = None,
+        initial_current: float | None = None,
+    ) -> "Inductor":
+        """Create an inductor without validation.
+
+        See TwoTerminalComponent.unchecked(); initial_current is the
+        optional initial current for transient analysis.
+        """
+        self = super().unchecked(name, node1, node2, value, value_str)
+        object.__setattr__(self, "_initial_current", initial_current)
+        return self
 
-    def to_spice(self) -> str:
-        """Generate SPICE netlist line."""
-        base = super().to_spice()
+    def _build_spice(self) -> str:
+        """Build SPICE netlist line."""
+        base = super()._build_spice()
         if self.initial_current is not None:
             return f"{base} IC={self.initial_current}"
         return base
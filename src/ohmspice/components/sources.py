@@ -1,8 +1,51 @@
 """Source components: VoltageSource, CurrentSource."""
 
-from typing import Any
+from typing import Any, NamedTuple, TypeVar
 
-from ohmspice.components.base import Component
+from ohmspice.components.base import Component, _SpiceAttribute
+
+
+class PulseParams(NamedTuple):
+    """PULSE waveform parameters: PULSE(v1 v2 td tr tf pw per)."""
+
+    v1: float = 0
+    v2: float = 0
+    td: float = 0
+    tr: float = 0
+    tf: float = 0
+    pw: float = 0
+    per: float = 0
+
+
+class SineParams(NamedTuple):
+    """SINE waveform parameters: SINE(vo va freq [td theta])."""
+
+    vo: float = 0
+    va: float = 0
+    freq: float = 0
+    td: float = 0
+    theta: float = 0
+
+
+_Params = TypeVar("_Params", PulseParams, SineParams)
+
+
+def _waveform_params(
+    params_type: type[_Params], params: _Params | dict[str, Any] | None, kind: str
+) -> _Params | None:
+    """Convert a waveform parameter dict to its NamedTuple.
+
+    Raises:
+        ValueError: If the dict has keys the waveform does not define.
+    """
+    if not isinstance(params, dict):
+        return params
+    try:
+        return params_type(**params)
+    except TypeError:
+        unknown_keys: set[str] = set(params) - set(params_type._fields)
+        unknown = ", ".join(sorted(unknown_keys))
+        raise ValueError(f"Unknown {kind} parameter(s): {unknown}") from None
 
 
 class VoltageSource(Component):
@@ -30,6 +73,12 @@ class VoltageSource(Component):
         'V3 in 0 DC 0 AC 1 0'
     """
 
+    __slots__ = ("_dc", "_ac", "_ac_phase", "_pulse", "_sine")
+
+    dc: _SpiceAttribute[float | None] = _SpiceAttribute("_dc", "DC voltage value.")
+    ac: _SpiceAttribute[float | None] = _SpiceAttribute("_ac", "AC magnitude.")
+    ac_phase: _SpiceAttribute[float] = _SpiceAttribute("_ac_phase", "AC phase in degrees.")
+
     PREFIX = "V"
 
     def __init__(
@@ -41,8 +90,8 @@ class VoltageSource(Component):
         dc: float | None = None,
         ac: float | None = None,
         ac_phase: float = 0,
-        pulse: dict[str, Any] | None = None,
-        sine: dict[str, Any] | None = None,
+        pulse: PulseParams | dict[str, Any] | None = None,
+        sine: SineParams | dict[str, Any] | None = None,
     ) -> None:
         """Create a voltage source.
 
@@ -53,7 +102,7 @@ class VoltageSource(Component):
             dc: DC voltage value.
             ac: AC magnitude for AC analysis.
             ac_phase: AC phase in degrees (default 0).
-            pulse: Pulse parameters dict with keys:
+            pulse: Pulse parameters, as PulseParams or a dict with keys:
                 - v1: Initial value
                 - v2: Pulsed value
                 - td: Delay time (default 0)
@@ -61,7 +110,7 @@ class VoltageSource(Component):
                 - tf: Fall time (default 0)
                 - pw: Pulse width
                 - per: Period
-            sine: Sine parameters dict with keys:
+            sine: Sine parameters, as SineParams or a dict with keys:
                 - vo: DC offset
                 - va: Amplitude
                 - freq: Frequency in Hz
@@ -69,25 +118,43 @@ class VoltageSource(Component):
                 - theta: Damping factor (default 0)
 
         Raises:
-            ValueError: If name doesn't start with 'V' or no source type specified.
+            ValueError: If name doesn't start with 'V', no source type is
+                specified, or a waveform dict has unknown keys.
         """
         super().__init__(name, node_pos, node_neg)
 
-        if not name.upper().startswith("V"):
-            raise ValueError(f"Voltage source name must start with 'V', got '{name}'")
-
-        self.dc = dc
-        self.ac = ac
-        self.ac_phase = ac_phase
-        self.pulse = pulse
-        self.sine = sine
+        self._dc = dc
+        self._ac = ac
+        self._ac_phase = ac_phase
+        self._pulse = None if pulse is None else _waveform_params(PulseParams, pulse, "pulse")
+        self._sine = None if sine is None else _waveform_params(SineParams, sine, "sine")
 
         # Validate that at least one source type is specified
         if all(x is None for x in [dc, ac, pulse, sine]):
             raise ValueError("At least one source type (dc, ac, pulse, sine) must be specified")
 
-    def to_spice(self) -> str:
-        """Generate SPICE netlist line."""
+    @property
+    def pulse(self) -> PulseParams | None:
+        """Pulse waveform parameters."""
+        return self._pulse
+
+    @pulse.setter
+    def pulse(self, value: PulseParams | dict[str, Any] | None) -> None:
+        self._pulse = _waveform_params(PulseParams, value, "pulse")
+        self._spice_cache = None
+
+    @property
+    def sine(self) -> SineParams | None:
+        """Sine waveform parameters."""
+        return self._sine
+
+    @sine.setter
+    def sine(self, value: SineParams | dict[str, Any] | None) -> None:
+        self._sine = _waveform_params(SineParams, value, "sine")
+        self._spice_cache = None
+
+    def _build_spice(self) -> str:
+        """Build SPICE netlist line."""
         parts = [self.name, self.node1, self.node2]
 
         # DC value
@@ -102,21 +169,16 @@ class VoltageSource(Component):
                 parts.append(f"AC {self.ac}")
 
         # Pulse waveform
-        if self.pulse is not None:
-            p = self.pulse
-            pulse_str = (
-                f"PULSE({p.get('v1', 0)} {p.get('v2', 0)} "
-                f"{p.get('td', 0)} {p.get('tr', 0)} {p.get('tf', 0)} "
-                f"{p.get('pw', 0)} {p.get('per', 0)})"
-            )
-            parts.append(pulse_str)
+        if self._pulse is not None:
+            p = self._pulse
+            parts.append(f"PULSE({p.v1} {p.v2} {p.td} {p.tr} {p.tf} {p.pw} {p.per})")
 
         # Sine waveform
-        if self.sine is not None:
-            s = self.sine
-            sine_str = f"SINE({s.get('vo', 0)} {s.get('va', 0)} {s.get('freq', 0)}"
-            if s.get("td", 0) != 0 or s.get("theta", 0) != 0:
-                sine_str += f" {s.get('td', 0)} {s.get('theta', 0)}"
+        if self._sine is not None:
+            s = self._sine
+            sine_str = f"SINE({s.vo} {s.va} {s.freq}"
+            if s.td != 0 or s.theta != 0:
+                sine_str += f" {s.td} {s.theta}"
             sine_str += ")"
             parts.append(sine_str)
 
@@ -150,6 +212,12 @@ class CurrentSource(Component):
         'I1 in 0 DC 0.001'
     """
 
+    __slots__ = ("_dc", "_ac", "_ac_phase")
+
+    dc: _SpiceAttribute[float | None] = _SpiceAttribute("_dc", "DC current value in amperes.")
+    ac: _SpiceAttribute[float | None] = _SpiceAttribute("_ac", "AC magnitude.")
+    ac_phase: _SpiceAttribute[float] = _SpiceAttribute("_ac_phase", "AC phase in degrees.")
+
     PREFIX = "I"
 
     def __init__(
@@ -177,18 +245,15 @@ class CurrentSource(Component):
         """
         super().__init__(name, node_pos, node_neg)
 
-        if not name.upper().startswith("I"):
-            raise ValueError(f"Current source name must start with 'I', got '{name}'")
-
-        self.dc = dc
-        self.ac = ac
-        self.ac_phase = ac_phase
+        self._dc = dc
+        self._ac = ac
+        self._ac_phase = ac_phase
 
         if dc is None and ac is None:
             raise ValueError("At least one source type (dc, ac) must be specified")
 
-    def to_spice(self) -> str:
-        """Generate SPICE netlist line."""
+    def _build_spice(self) -> str:
+        """Build SPICE netlist line."""
         parts = [self.name, self.node1, self.node2]
 
         if self.dc is not None:
@@ -12,7 +12,11 @@ Supports SPICE engineering notation:
 - t = tera (1e12)
 """
 
+import bisect
+import functools
+import math
 import re
+import string
 
 # SPICE multiplier prefixes
 MULTIPLIERS: dict[str, float] = {
@@ -28,6 +32,9 @@ MULTIPLIERS: dict[str, float] = {
     "t": 1e12,
 }
 
+# Characters that may follow the number: multiplier and unit letters
+_SUFFIX_CHARS = string.ascii_lowercase + "µω"
+
 # Reverse lookup for formatting
 REVERSE_MULTIPLIERS: list[tuple[float, str]] = [
     (1e12, "T"),
@@ -42,11 +49,14 @@ REVERSE_MULTIPLIERS: list[tuple[float, str]] = [
     (1e-15, "f"),
 ]
 
-# Pattern to match value with optional multiplier
+# REVERSE_MULTIPLIERS in ascending order, for bisect lookups in format_value
+_SCALES = REVERSE_MULTIPLIERS[::-1]
+_THRESHOLDS = [threshold for threshold, _ in _SCALES]
+_MIN_SCALE = _THRESHOLDS[0]
+
+# Pattern to match value with optional multiplier, applied to lowercased input
 # Note: 'meg' must come before 'm' for correct matching
-VALUE_PATTERN = re.compile(
-    r"^([+-]?\d+\.?\d*(?:[eE][+-]?\d+)?)\s*(meg|f|p|n|u|µ|m|k|g|t)?(.*)$", re.IGNORECASE
-)
+VALUE_PATTERN = re.compile(r"^([+-]?\d+\.?\d*(?:e[+-]?\d+)?)\s*(meg|f|p|n|u|µ|m|k|g|t)?(.*)$")
 
 
 def parse_value(value: str | int | float) -> float:
@@ -78,11 +88,33 @@ def parse_value(value: str | int | float) -> float:
     if not isinstance(value, str):
         raise ValueError(f"Cannot parse value: {value}")
 
+    return _parse_value_str(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_value_str(value: str) -> float:
+    """Parse a value string; memoized since netlists repeat the same values."""
     value = value.strip()
     if not value:
         raise ValueError("Empty value string")
 
-    match = VALUE_PATTERN.match(value)
+    lowered = value.lower()
+
+    # Split off trailing multiplier/unit letters and let float() parse the
+    # number; the regex is only needed for unusual forms such as "1k5"
+    if "_" not in lowered:
+        number_str = lowered.rstrip(_SUFFIX_CHARS)
+        try:
+            number = float(number_str)
+        except ValueError:
+            pass
+        else:
+            suffix = lowered[len(number_str) :].lstrip()
+            if suffix.startswith("meg"):
+                return number * 1e6
+            return number * MULTIPLIERS.get(suffix[:1], 1.0)
+
+    match = VALUE_PATTERN.match(lowered)
     if not match:
         raise ValueError(f"Invalid value format: {value}")
 
@@ -90,18 +122,21 @@ def parse_value(value: str | int | float) -> float:
     number = float(number_str)
 
     if multiplier:
-        multiplier_lower = multiplier.lower()
-        if multiplier_lower in MULTIPLIERS:
-            number *= MULTIPLIERS[multiplier_lower]
+        if multiplier in MULTIPLIERS:
+            number *= MULTIPLIERS[multiplier]
         else:
             raise ValueError(f"Unknown multiplier: {multiplier}")
 
     return number
 
 
+@functools.lru_cache(maxsize=4096)
 def format_value(value: float, unit: str = "") -> str:
     """Format a float value using engineering notation.
 
+    Results are memoized: templates format the same default values (and
+    netlists the same component values) over and over.
+
     Args:
         value: The value to format.
         unit: Optional unit suffix (e.g., 'Ω', 'F', 'H').
@@ -123,16 +158,18 @@ def format_value(value: float, unit: str = "") -> str:
     abs_value = abs(value)
     sign = "-" if value < 0 else ""
 
-    for threshold, suffix in REVERSE_MULTIPLIERS:
-        if abs_value >= threshold:
-            scaled = abs_value / threshold
-            # Format to avoid unnecessary decimals
-            if scaled == int(scaled):
-                return f"{sign}{int(scaled)}{suffix}{unit}"
-            else:
-                # Round to 3 significant digits
-                formatted = f"{scaled:.3g}"
-                return f"{sign}{formatted}{suffix}{unit}"
-
-    # Fallback for very small values
-    return f"{sign}{value}{unit}"
+    # Fallback for very small values (and inf/nan)
+    if not abs_value >= _MIN_SCALE or abs_value == math.inf:
+        return f"{sign}{value}{unit}"
+
+    # Binary search the ascending thresholds instead of scanning the table
+    threshold, suffix = _SCALES[bisect.bisect_right(_THRESHOLDS, abs_value) - 1]
+
+    scaled = abs_value / threshold
+    # Format to avoid unnecessary decimals
+    if scaled.is_integer():
+        return f"{sign}{int(scaled)}{suffix}{unit}"
+    else:
+        # Round to 3 significant digits
+        formatted = f"{scaled:.3g}"
+        return f"{sign}{formatted}{suffix}{unit}"
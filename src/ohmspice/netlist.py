@@ -47,11 +47,12 @@ class NetlistGenerator:
         if not path.suffix:
             path = path.with_suffix(".cir")
 
-        # Create parent directories if needed
-        path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write netlist
-        netlist = self.generate(circuit)
-        path.write_text(netlist, encoding="utf-8")
+        # Write netlist, creating parent directories only if the first
+        # attempt shows they are missing (saves a stat per ancestor)
+        try:
+            circuit.save(path)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            circuit.save(path)
 
         return path
@@ -1,8 +1,13 @@
 """LTspice simulator backend."""
 
+import atexit
 import os
+import platform
+import shutil
 import subprocess
 import tempfile
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -16,6 +21,12 @@ if TYPE_CHECKING:
     from ohmspice.analysis.results import SimulationResults
     from ohmspice.circuit import Circuit
 
+# The OS never changes during a session, so probe it once at import
+_SYSTEM = platform.system()
+
+# Marks a cache slot that has not been filled yet (None is a valid result)
+_UNSET = object()
+
 
 class LTSpice(Simulator):
     """LTspice simulator backend.
@@ -51,6 +62,12 @@ class LTSpice(Simulator):
         "/Applications/LTspice.app/Contents/MacOS/LTspice",
     ]
 
+    # Result of the first is_available() probe
+    _availability: bool | None = None
+
+    # Result of the first find_executable() search, or _UNSET
+    _executable: Path | None | object = _UNSET
+
     def __init__(self, executable: str | Path | None = None) -> None:
         """Initialize LTspice simulator.
 
@@ -74,27 +91,62 @@ class LTSpice(Simulator):
                 )
             self.executable = found
 
+        # Idle scratch directories reused by run(). A new one is only created
+        # while every existing one is busy, so there are never more than the
+        # peak number of concurrent runs
+        self._idle_workdirs: list[Path] = []
+
+    @property
+    def executable(self) -> Path:
+        """Path to the LTspice executable."""
+        return self._executable_path
+
+    @executable.setter
+    def executable(self, value: str | Path) -> None:
+        self._executable_path = Path(value)
+        # LTspice command line arguments
+        # -b: batch mode (no GUI)
+        # -Run: run simulation
+        self._cmd_prefix = [str(self._executable_path), "-b", "-Run"]
+
     @classmethod
     def is_available(cls) -> bool:
-        """Check if LTspice is available on the system."""
-        return cls.find_executable() is not None
+        """Check if LTspice is available on the system.
+
+        The filesystem probe runs once; later calls return the cached result.
+        Use reset_availability_cache() after installing LTspice mid-session.
+        """
+        if cls._availability is None:
+            cls._availability = cls.find_executable() is not None
+        return cls._availability
+
+    @classmethod
+    def reset_availability_cache(cls) -> None:
+        """Forget the cached is_available() and find_executable() results."""
+        cls._availability = None
+        cls._executable = _UNSET
 
     @classmethod
     def find_executable(cls) -> Path | None:
         """Find LTspice executable.
 
         Searches common installation locations based on the operating system.
+        The search runs once; later calls return the cached result until
+        reset_availability_cache() is called.
 
         Returns:
             Path to LTspice executable, or None if not found.
         """
-        import platform
-
-        system = platform.system()
+        if cls._executable is _UNSET:
+            cls._executable = cls._search_executable()
+        return cls._executable  # type: ignore[return-value]
 
-        if system == "Windows":
+    @classmethod
+    def _search_executable(cls) -> Path | None:
+        """Search the filesystem for the LTspice executable."""
+        if _SYSTEM == "Windows":
             paths = cls.WINDOWS_PATHS
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             paths = cls.MACOS_PATHS
         else:  # Linux - check for Wine
             # TODO: Add Wine support
@@ -106,8 +158,6 @@ class LTSpice(Simulator):
                 return path
 
         # Check if ltspice is in PATH
-        import shutil
-
         ltspice_in_path = shutil.which("ltspice") or shutil.which("XVIIx64")
         if ltspice_in_path:
             return Path(ltspice_in_path)
@@ -122,7 +172,9 @@ class LTSpice(Simulator):
     ) -> "SimulationResults":
         """Run simulation on a circuit.
 
-        Creates a temporary netlist file, runs LTspice, and parses results.
+        Writes the netlist into a scratch directory reused across calls,
+        runs LTspice, and parses results. The netlist and LTspice's output
+        files are removed once the results are parsed.
 
         Args:
             circuit: The circuit to simulate.
@@ -134,27 +186,71 @@ class LTSpice(Simulator):
         Raises:
             SimulationError: If simulation fails.
         """
-        # Create temporary netlist file
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".cir",
-            delete=False,
-            encoding="utf-8",
-        ) as f:
-            f.write(circuit.to_netlist())
-            netlist_path = Path(f.name)
-
+        workdir = self._acquire_workdir()
+        netlist_path = workdir / "sim.cir"
         try:
+            with netlist_path.open("w", encoding="utf-8") as f:
+                circuit.write(f)
             return self.run_netlist(netlist_path, timeout=timeout)
         finally:
-            # Clean up temporary files
-            try:
-                netlist_path.unlink(missing_ok=True)
-                # Also clean up .raw and .log files
-                netlist_path.with_suffix(".raw").unlink(missing_ok=True)
-                netlist_path.with_suffix(".log").unlink(missing_ok=True)
-            except OSError:
-                pass
+            self._release_workdir(workdir)
+
+    def run_batch(
+        self,
+        circuits: Iterable["Circuit"],
+        *,
+        timeout: float | None = 60.0,
+        max_workers: int | None = None,
+    ) -> list["SimulationResults"]:
+        """Run several circuits in parallel.
+
+        Each LTspice process is single-threaded, so independent circuits
+        (parameter sweeps, Monte Carlo runs) scale across cores. The worker
+        threads only wait on subprocesses, each in its own scratch directory;
+        the directories are kept for reuse by later runs and batches.
+
+        Args:
+            circuits: The circuits to simulate.
+            timeout: Maximum time to wait for each simulation (seconds).
+            max_workers: Maximum number of concurrent simulations.
+                Defaults to ``os.cpu_count()``.
+
+        Returns:
+            Results in the same order as ``circuits``.
+
+        Raises:
+            SimulationError: If any simulation fails.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            return list(executor.map(lambda c: self.run(c, timeout=timeout), circuits))
+
+    def _acquire_workdir(self) -> Path:
+        """Take an idle scratch directory, creating one if all are busy."""
+        # list.pop() and list.append() are atomic, so no lock is needed
+        try:
+            return self._idle_workdirs.pop()
+        except IndexError:
+            workdir = Path(tempfile.mkdtemp(prefix="ohmspice-"))
+            atexit.register(shutil.rmtree, workdir, ignore_errors=True)
+            return workdir
+
+    def _release_workdir(self, workdir: Path) -> None:
+        """Empty a scratch directory after a run and make it available again.
+
+        Results are copied out of the .raw file while parsing, so nothing
+        needs it afterwards. If a file cannot be removed (e.g. still open on
+        Windows), the directory is deleted instead of reused so a later run
+        cannot pick up stale output.
+        """
+        netlist_path = workdir / "sim.cir"
+        try:
+            netlist_path.unlink(missing_ok=True)
+            netlist_path.with_suffix(".raw").unlink(missing_ok=True)
+            netlist_path.with_suffix(".log").unlink(missing_ok=True)
+        except OSError:
+            shutil.rmtree(workdir, ignore_errors=True)
+            return
+        self._idle_workdirs.append(workdir)
 
     def run_netlist(
         self,
@@ -181,16 +277,14 @@ class LTSpice(Simulator):
         if not netlist_path.exists():
             raise FileNotFoundError(f"Netlist file not found: {netlist_path}")
 
-        # LTspice command line arguments
-        # -b: batch mode (no GUI)
-        # -Run: run simulation
-        cmd = [str(self.executable), "-b", "-Run", str(netlist_path)]
+        cmd = [*self._cmd_prefix, str(netlist_path)]
 
         try:
+            # Console output is discarded; errors are read from the .log file
             subprocess.run(
                 cmd,
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=timeout,
                 cwd=netlist_path.parent,
             )
@@ -9,16 +9,41 @@ Example:
     >>> print(circuit.to_netlist())
 """
 
-from ohmspice.templates import amplifiers, filters, oscillators, power
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from ohmspice.templates.base import CircuitTemplate, TemplateInfo, TemplateParameter
 
+if TYPE_CHECKING:
+    from ohmspice.templates import amplifiers, filters, oscillators, power
+
+# Category submodules are imported on first access (PEP 562)
+_SUBMODULES = ("filters", "amplifiers", "oscillators", "power")
+
+# Name of each category's template registry dict
+_REGISTRIES = {
+    "filters": "FILTER_TEMPLATES",
+    "amplifiers": "AMPLIFIER_TEMPLATES",
+    "oscillators": "OSCILLATOR_TEMPLATES",
+    "power": "POWER_TEMPLATES",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import category submodules on first access."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def list_all_templates() -> dict[str, list[TemplateInfo]]:
+
+def list_all_templates() -> dict[str, tuple[TemplateInfo, ...]]:
     """List all available templates organized by category.
 
     Returns:
-        Dictionary with category names as keys and list of TemplateInfo as values.
+        Dictionary with category names as keys and tuples of TemplateInfo as values.
     """
+    from ohmspice.templates import amplifiers, filters, oscillators, power
+
     return {
         "filters": filters.list_templates(),
         "amplifiers": amplifiers.list_templates(),
@@ -30,19 +55,21 @@ def list_all_templates() -> dict[str, list[TemplateInfo]]:
 def get_template(name: str) -> CircuitTemplate | None:
     """Get a template by name.
 
+    Categories are imported one at a time and the search stops at the
+    first match, so looking up a filter never imports the power templates.
+
     Args:
         name: Template name (e.g., 'rc_lowpass', 'voltage_divider').
 
     Returns:
         CircuitTemplate instance or None if not found.
     """
-    all_templates = {
-        **filters.FILTER_TEMPLATES,
-        **amplifiers.AMPLIFIER_TEMPLATES,
-        **oscillators.OSCILLATOR_TEMPLATES,
-        **power.POWER_TEMPLATES,
-    }
-    return all_templates.get(name)
+    for category, registry in _REGISTRIES.items():
+        module = importlib.import_module(f"{__name__}.{category}")
+        template: CircuitTemplate | None = getattr(module, registry).get(name)
+        if template is not None:
+            return template
+    return None
 
 
 __all__ = [
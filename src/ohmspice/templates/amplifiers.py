@@ -10,12 +10,16 @@ Note: These templates require OpAmp component which will be
 added in a future version. For now, they use simplified models.
 """
 
-from typing import Any
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from ohmspice.circuit import Circuit
-from ohmspice.components.utils import format_value
 from ohmspice.templates.base import CircuitTemplate, TemplateInfo, TemplateParameter
 
+if TYPE_CHECKING:
+    from ohmspice.circuit import Circuit
+
 
 class InvertingAmplifierTemplate(CircuitTemplate):
     """Inverting Amplifier template.
@@ -28,6 +32,7 @@ class InvertingAmplifierTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="inverting",
@@ -50,39 +55,46 @@ class InvertingAmplifierTemplate(CircuitTemplate):
         Returns:
             Dictionary with 'r_in' and 'r_f' values.
         """
-        gain = abs(specs["gain"])
-        r_in = specs.get("r_in", 10000)
+        return self._compute(abs(specs["gain"]), specs.get("r_in", 10000))
 
+    @staticmethod
+    def _compute(abs_gain: float, r_in: float) -> dict[str, Any]:
+        """Calculate resistor values from the absolute gain."""
         # Gain = Rf / Rin => Rf = Gain * Rin
-        r_f = gain * r_in
+        r_f = abs_gain * r_in
 
-        return {"r_in": r_in, "r_f": r_f, "gain": -gain}
+        return {"r_in": r_in, "r_f": r_f, "gain": -abs_gain}
 
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create Inverting Amplifier circuit.
 
         Uses behavioral model with VCVS (E element) for op-amp.
         """
-        gain = params["gain"]
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
+
+        abs_gain = abs(params["gain"])
         r_in = params.get("r_in", 10000)
         include_source = params.get("include_source", True)
 
-        values = self.calculate_values(gain=gain, r_in=r_in)
+        values = self._compute(abs_gain, r_in)
 
-        circuit = Circuit(f"Inverting Amplifier (Gain=-{abs(gain)})")
+        circuit = Circuit(f"Inverting Amplifier (Gain=-{abs_gain})")
 
         if include_source:
             circuit.add_voltage_source("V1", "in", "0", ac=1)
 
-        # Input resistor
-        circuit.add_resistor("Rin", "in", "neg_input", format_value(values["r_in"], "R"))
-
-        # Feedback resistor
-        circuit.add_resistor("Rf", "neg_input", "out", format_value(values["r_f"], "R"))
-
-        # Virtual ground at neg_input (simulated by connecting to proper op-amp model)
-        # For now, add a resistor to ground as simplified model
-        circuit.add_resistor("Rv", "neg_input", "0", "1G")  # High impedance
+        circuit.add_components(
+            [
+                # Input resistor
+                ("Rin", "in", "neg_input", format_value(values["r_in"], "R")),
+                # Feedback resistor
+                ("Rf", "neg_input", "out", format_value(values["r_f"], "R")),
+                # Virtual ground at neg_input (simulated by connecting to proper op-amp model)
+                # For now, add a resistor to ground as simplified model
+                ("Rv", "neg_input", "0", "1G"),  # High impedance
+            ]
+        )
 
         # Note: Full op-amp model will be added when OpAmp component is implemented
 
@@ -99,6 +111,7 @@ class NonInvertingAmplifierTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="noninverting",
@@ -121,24 +134,33 @@ class NonInvertingAmplifierTemplate(CircuitTemplate):
         Returns:
             Dictionary with 'r1' and 'r_f' values.
         """
-        gain = specs["gain"]
+        return self._compute(specs["gain"], specs.get("r1", 10000))
+
+    @staticmethod
+    def _compute(gain: float, r1: float) -> dict[str, Any]:
+        """Calculate resistor values from already-parsed specifications.
+
+        Raises:
+            ValueError: If gain is below 1.
+        """
         if gain < 1:
             raise ValueError("Non-inverting amplifier gain must be >= 1")
 
-        r1 = specs.get("r1", 10000)
-
         # Gain = 1 + Rf/R1 => Rf = R1 * (Gain - 1)
         r_f = r1 * (gain - 1)
 
         return {"r1": r1, "r_f": r_f, "gain": gain}
 
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create Non-Inverting Amplifier circuit."""
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
+
         gain = params["gain"]
         r1 = params.get("r1", 10000)
         include_source = params.get("include_source", True)
 
-        values = self.calculate_values(gain=gain, r1=r1)
+        values = self._compute(gain, r1)
 
         circuit = Circuit(f"Non-Inverting Amplifier (Gain={gain})")
 
@@ -146,12 +168,15 @@ class NonInvertingAmplifierTemplate(CircuitTemplate):
             circuit.add_voltage_source("V1", "in", "0", ac=1)
 
         # Input goes to positive input of op-amp
-        # Feedback network
-        circuit.add_resistor("R1", "neg_input", "0", format_value(values["r1"], "R"))
-        circuit.add_resistor("Rf", "neg_input", "out", format_value(values["r_f"], "R"))
-
-        # Simplified model connection
-        circuit.add_resistor("Rv", "in", "neg_input", "1G")
+        circuit.add_components(
+            [
+                # Feedback network
+                ("R1", "neg_input", "0", format_value(values["r1"], "R")),
+                ("Rf", "neg_input", "out", format_value(values["r_f"], "R")),
+                # Simplified model connection
+                ("Rv", "in", "neg_input", "1G"),
+            ]
+        )
 
         circuit.add_ac_analysis(start=1, stop=1e6, points_per_decade=20)
 
@@ -164,7 +189,7 @@ _noninverting_template = NonInvertingAmplifierTemplate()
 
 
 # Factory functions
-def inverting(gain: float, r_in: float = 10000, include_source: bool = True) -> Circuit:
+def inverting(gain: float, r_in: float = 10000, include_source: bool = True) -> "Circuit":
     """Create an Inverting Amplifier.
 
     Args:
@@ -179,10 +204,10 @@ def inverting(gain: float, r_in: float = 10000, include_source: bool = True) ->
         >>> circuit = inverting(gain=10)  # -10x gain
         >>> print(circuit.to_netlist())
     """
-    return _inverting_template.create(gain=gain, r_in=r_in, include_source=include_source)
+    return _inverting_template.create_cached(gain=gain, r_in=r_in, include_source=include_source)
 
 
-def noninverting(gain: float, r1: float = 10000, include_source: bool = True) -> Circuit:
+def noninverting(gain: float, r1: float = 10000, include_source: bool = True) -> "Circuit":
     """Create a Non-Inverting Amplifier.
 
     Args:
@@ -197,16 +222,22 @@ def noninverting(gain: float, r1: float = 10000, include_source: bool = True) ->
         >>> circuit = noninverting(gain=2)  # 2x gain
         >>> print(circuit.to_netlist())
     """
-    return _noninverting_template.create(gain=gain, r1=r1, include_source=include_source)
+    return _noninverting_template.create_cached(gain=gain, r1=r1, include_source=include_source)
 
 
 # Registry
-AMPLIFIER_TEMPLATES: dict[str, CircuitTemplate] = {
-    "inverting": _inverting_template,
-    "noninverting": _noninverting_template,
-}
+AMPLIFIER_TEMPLATES: Mapping[str, CircuitTemplate] = MappingProxyType(
+    {
+        "inverting": _inverting_template,
+        "noninverting": _noninverting_template,
+    }
+)
+
+
+# Template metadata is static, so list_templates() returns a precomputed tuple
+_AMPLIFIER_INFOS: tuple[TemplateInfo, ...] = tuple(t.info() for t in AMPLIFIER_TEMPLATES.values())
 
 
-def list_templates() -> list[TemplateInfo]:
+def list_templates() -> tuple[TemplateInfo, ...]:
     """List all available amplifier templates."""
-    return [template.info() for template in AMPLIFIER_TEMPLATES.values()]
+    return _AMPLIFIER_INFOS
@@ -5,14 +5,17 @@ Templates are pre-configured circuit designs that can be customized
 with parameters.
 """
 
+import functools
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
-from ohmspice.circuit import Circuit
+if TYPE_CHECKING:
+    from ohmspice.circuit import Circuit
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemplateParameter:
     """Describes a parameter for a circuit template.
 
@@ -31,23 +34,36 @@ class TemplateParameter:
     default: Any = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TemplateInfo:
     """Metadata about a circuit template.
 
+    Instances are immutable because template info() results are cached and
+    shared; parameters is stored as a tuple.
+
     Attributes:
         name: Template name (e.g., 'rc_lowpass').
         display_name: Human-readable name.
         description: Template description.
         category: Category (filters, amplifiers, etc.).
-        parameters: List of template parameters.
+        parameters: Template parameters.
     """
 
     name: str
     display_name: str
     description: str
     category: str
-    parameters: list[TemplateParameter] = field(default_factory=list)
+    parameters: Sequence[TemplateParameter] = ()
+
+    def __post_init__(self) -> None:
+        """Store parameters as a tuple."""
+        object.__setattr__(self, "parameters", tuple(self.parameters))
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _create_prototype(template: "CircuitTemplate", **params: Any) -> "Circuit":
+    """Create and memoize a template circuit; callers must only copy it."""
+    return template.create(**params)
 
 
 class CircuitTemplate(ABC):
@@ -73,7 +89,7 @@ class CircuitTemplate(ABC):
         ...             ]
         ...         )
         ...
-        ...     def create(self, **params) -> Circuit:
+        ...     def create(self, **params) -> "Circuit":
         ...         fc = params['fc']
         ...         r = params.get('r')
         ...         c = params.get('c')
@@ -89,13 +105,16 @@ class CircuitTemplate(ABC):
     def info(cls) -> TemplateInfo:
         """Return template metadata.
 
+        Implementations are decorated with functools.cache, since the
+        metadata is static.
+
         Returns:
             TemplateInfo with name, description, and parameters.
         """
         ...
 
     @abstractmethod
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create a circuit from parameters.
 
         Args:
@@ -121,6 +140,20 @@ class CircuitTemplate(ABC):
         """
         ...
 
+    def create_cached(self, **params: Any) -> "Circuit":
+        """Create a circuit, reusing the result of earlier identical calls.
+
+        The circuit for each distinct set of (hashable) parameters is built
+        once; every call returns a fresh copy of it that is safe to modify.
+
+        Args:
+            **params: Template-specific parameters.
+
+        Returns:
+            Configured Circuit instance.
+        """
+        return _create_prototype(self, **params).copy()
+
     def validate_params(self, **params: Any) -> list[str]:
         """Validate parameters against template requirements.
 
@@ -130,11 +163,14 @@ class CircuitTemplate(ABC):
         Returns:
             List of error messages (empty if valid).
         """
-        errors = []
-        info = self.info()
+        return [
+            f"Missing required parameter: {name}"
+            for name in self._required_params()
+            if name not in params
+        ]
 
-        for param in info.parameters:
-            if param.required and param.name not in params:
-                errors.append(f"Missing required parameter: {param.name}")
-
-        return errors
+    @classmethod
+    @functools.cache
+    def _required_params(cls) -> tuple[str, ...]:
+        """Return the names of required parameters, in declaration order."""
+        return tuple(param.name for param in cls.info().parameters if param.required)
@@ -14,13 +14,51 @@ Example:
     >>> print(circuit.to_netlist())
 """
 
+import functools
 import math
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from ohmspice.circuit import Circuit
-from ohmspice.components.utils import format_value
 from ohmspice.templates.base import CircuitTemplate, TemplateInfo, TemplateParameter
 
+if TYPE_CHECKING:
+    from ohmspice.circuit import Circuit
+
+_TWO_PI = 2 * math.pi
+
+
+def _rc_pair(fc: float, r: float | None, c: float | None) -> dict[str, Any]:
+    """Complete an RC pair for cutoff frequency fc = 1 / (2π * R * C).
+
+    If both R and C are given they are returned unchanged (fc is then
+    determined by them); if neither is given, R defaults to 1kΩ.
+    """
+    if r is not None and c is not None:
+        return {"r": r, "c": c}
+    if c is not None:
+        # Calculate R from fc and C
+        return {"r": 1 / (_TWO_PI * fc * c), "c": c}
+    if r is None:
+        r = 1000
+    # Calculate C from fc and R
+    return {"r": r, "c": 1 / (_TWO_PI * fc * r)}
+
+
+@functools.lru_cache(maxsize=64)
+def _rc_sweep(fc: float) -> tuple[float, float]:
+    """Return the AC sweep (start, stop) covering two decades around fc."""
+    start_freq = fc / 100 if fc > 100 else 1
+    stop_freq = fc * 100 if fc * 100 < 1e9 else 1e9
+    return start_freq, stop_freq
+
+
+@functools.lru_cache(maxsize=64)
+def _rlc_sweep(fc: float, q: float) -> tuple[float, float]:
+    """Return the AC sweep (start, stop) spanning five bandwidths around fc."""
+    bw = fc / q
+    return max(1, fc - 5 * bw), fc + 5 * bw
+
 
 class RCLowPassTemplate(CircuitTemplate):
     """RC Low-Pass Filter template.
@@ -34,6 +72,7 @@ class RCLowPassTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="rc_lowpass",
@@ -56,33 +95,12 @@ class RCLowPassTemplate(CircuitTemplate):
             c: Capacitance in Farads (optional).
 
         Returns:
-            Dictionary with 'r' and 'c' values.
-
-        Raises:
-            ValueError: If neither r nor c is specified.
+            Dictionary with 'r' and 'c' values. R defaults to 1kΩ when
+            neither r nor c is specified.
         """
-        fc = specs["fc"]
-        r = specs.get("r")
-        c = specs.get("c")
-
-        if r is not None and c is not None:
-            # Both given, ignore fc for values (fc is determined by R and C)
-            return {"r": r, "c": c}
-        elif r is not None:
-            # Calculate C from fc and R
-            c = 1 / (2 * math.pi * fc * r)
-            return {"r": r, "c": c}
-        elif c is not None:
-            # Calculate R from fc and C
-            r = 1 / (2 * math.pi * fc * c)
-            return {"r": r, "c": c}
-        else:
-            # Default: use R = 1kΩ
-            r = 1000
-            c = 1 / (2 * math.pi * fc * r)
-            return {"r": r, "c": c}
-
-    def create(self, **params: Any) -> Circuit:
+        return _rc_pair(specs["fc"], specs.get("r"), specs.get("c"))
+
+    def create(self, **params: Any) -> "Circuit":
         """Create RC Low-Pass Filter circuit.
 
         Args:
@@ -94,24 +112,30 @@ class RCLowPassTemplate(CircuitTemplate):
         Returns:
             Configured Circuit with AC analysis.
         """
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
+
         fc = params["fc"]
         r = params.get("r")
         c = params.get("c")
         include_source = params.get("include_source", True)
 
-        values = self.calculate_values(fc=fc, r=r, c=c)
+        values = _rc_pair(fc, r, c)
 
         circuit = Circuit(f"RC Low-Pass Filter (fc={fc}Hz)")
 
         if include_source:
             circuit.add_voltage_source("V1", "in", "0", ac=1)
 
-        circuit.add_resistor("R1", "in", "out", format_value(values["r"], "R"))
-        circuit.add_capacitor("C1", "out", "0", format_value(values["c"], "C"))
+        circuit.add_components(
+            [
+                ("R1", "in", "out", format_value(values["r"], "R")),
+                ("C1", "out", "0", format_value(values["c"], "C")),
+            ]
+        )
 
         # Add AC analysis covering frequencies around fc
-        start_freq = fc / 100 if fc > 100 else 1
-        stop_freq = fc * 100 if fc * 100 < 1e9 else 1e9
+        start_freq, stop_freq = _rc_sweep(fc)
         circuit.add_ac_analysis(start=start_freq, stop=stop_freq, points_per_decade=20)
 
         return circuit
@@ -128,6 +152,7 @@ class RCHighPassTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="rc_highpass",
@@ -143,31 +168,19 @@ class RCHighPassTemplate(CircuitTemplate):
 
     def calculate_values(self, **specs: Any) -> dict[str, Any]:
         """Calculate R and C values for given cutoff frequency."""
-        fc = specs["fc"]
-        r = specs.get("r")
-        c = specs.get("c")
-
-        if r is not None and c is not None:
-            return {"r": r, "c": c}
-        elif r is not None:
-            c = 1 / (2 * math.pi * fc * r)
-            return {"r": r, "c": c}
-        elif c is not None:
-            r = 1 / (2 * math.pi * fc * c)
-            return {"r": r, "c": c}
-        else:
-            r = 1000
-            c = 1 / (2 * math.pi * fc * r)
-            return {"r": r, "c": c}
-
-    def create(self, **params: Any) -> Circuit:
+        return _rc_pair(specs["fc"], specs.get("r"), specs.get("c"))
+
+    def create(self, **params: Any) -> "Circuit":
         """Create RC High-Pass Filter circuit."""
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
+
         fc = params["fc"]
         r = params.get("r")
         c = params.get("c")
         include_source = params.get("include_source", True)
 
-        values = self.calculate_values(fc=fc, r=r, c=c)
+        values = _rc_pair(fc, r, c)
 
         circuit = Circuit(f"RC High-Pass Filter (fc={fc}Hz)")
 
@@ -175,11 +188,14 @@ class RCHighPassTemplate(CircuitTemplate):
             circuit.add_voltage_source("V1", "in", "0", ac=1)
 
         # High-pass: C in series, R to ground
-        circuit.add_capacitor("C1", "in", "out", format_value(values["c"], "C"))
-        circuit.add_resistor("R1", "out", "0", format_value(values["r"], "R"))
+        circuit.add_components(
+            [
+                ("C1", "in", "out", format_value(values["c"], "C")),
+                ("R1", "out", "0", format_value(values["r"], "R")),
+            ]
+        )
 
-        start_freq = fc / 100 if fc > 100 else 1
-        stop_freq = fc * 100 if fc * 100 < 1e9 else 1e9
+        start_freq, stop_freq = _rc_sweep(fc)
         circuit.add_ac_analysis(start=start_freq, stop=stop_freq, points_per_decade=20)
 
         return circuit
@@ -197,6 +213,7 @@ class RLCBandpassTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="rlc_bandpass",
@@ -221,10 +238,11 @@ class RLCBandpassTemplate(CircuitTemplate):
         Returns:
             Dictionary with 'r', 'l', 'c' values.
         """
-        fc = specs["fc"]
-        q = specs.get("q", 10)
-        r = specs.get("r", 100)
+        return self._compute(specs["fc"], specs.get("q", 10), specs.get("r", 100))
 
+    @staticmethod
+    def _compute(fc: float, q: float, r: float) -> dict[str, Any]:
+        """Calculate R, L, C values from already-parsed specifications."""
         # From formulas:
         # fc = 1 / (2π * √(LC))  =>  LC = 1 / (2π*fc)²
         # Q = (1/R) * √(L/C)  =>  √(L/C) = Q*R  =>  L/C = (Q*R)²
@@ -233,23 +251,27 @@ class RLCBandpassTemplate(CircuitTemplate):
         # and L/C = M where M = (Q*R)²
         # Then: L = √(K*M) and C = √(K/M)
 
-        omega = 2 * math.pi * fc
+        omega = _TWO_PI * fc
         lc_product = 1 / (omega * omega)  # LC = 1/(ω²)
-        l_over_c = (q * r) ** 2  # L/C = (QR)²
+        qr = q * r
+        l_over_c = qr * qr  # L/C = (QR)²
 
         inductance = math.sqrt(lc_product * l_over_c)
         c = math.sqrt(lc_product / l_over_c)
 
         return {"r": r, "l": inductance, "c": c}
 
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create RLC Bandpass Filter circuit."""
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
+
         fc = params["fc"]
         q = params.get("q", 10)
         r = params.get("r", 100)
         include_source = params.get("include_source", True)
 
-        values = self.calculate_values(fc=fc, q=q, r=r)
+        values = self._compute(fc, q, r)
 
         circuit = Circuit(f"RLC Bandpass Filter (fc={fc}Hz, Q={q})")
 
@@ -257,14 +279,16 @@ class RLCBandpassTemplate(CircuitTemplate):
             circuit.add_voltage_source("V1", "in", "0", ac=1)
 
         # Series RLC configuration
-        circuit.add_resistor("R1", "in", "node1", format_value(values["r"], "R"))
-        circuit.add_inductor("L1", "node1", "out", format_value(values["l"], "L"))
-        circuit.add_capacitor("C1", "out", "0", format_value(values["c"], "C"))
+        circuit.add_components(
+            [
+                ("R1", "in", "node1", format_value(values["r"], "R")),
+                ("L1", "node1", "out", format_value(values["l"], "L")),
+                ("C1", "out", "0", format_value(values["c"], "C")),
+            ]
+        )
 
         # Analysis range based on bandwidth
-        bw = fc / q
-        start_freq = max(1, fc - 5 * bw)
-        stop_freq = fc + 5 * bw
+        start_freq, stop_freq = _rlc_sweep(fc, q)
         circuit.add_ac_analysis(start=start_freq, stop=stop_freq, points_per_decade=50)
 
         return circuit
@@ -278,6 +302,7 @@ class RLCNotchTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="rlc_notch",
@@ -293,28 +318,33 @@ class RLCNotchTemplate(CircuitTemplate):
 
     def calculate_values(self, **specs: Any) -> dict[str, Any]:
         """Calculate R, L, C values for given fc and Q."""
-        fc = specs["fc"]
-        q = specs.get("q", 10)
-        r = specs.get("r", 100)
+        return self._compute(specs["fc"], specs.get("q", 10), specs.get("r", 100))
 
-        omega = 2 * math.pi * fc
+    @staticmethod
+    def _compute(fc: float, q: float, r: float) -> dict[str, Any]:
+        """Calculate R, L, C values from already-parsed specifications."""
+        omega = _TWO_PI * fc
         lc_product = 1 / (omega * omega)
 
         # For notch: Q = R / √(L/C)
-        l_over_c = (r / q) ** 2
+        rq = r / q
+        l_over_c = rq * rq
         inductance = math.sqrt(lc_product * l_over_c)
         c = math.sqrt(lc_product / l_over_c)
 
         return {"r": r, "l": inductance, "c": c}
 
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create RLC Notch Filter circuit."""
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
+
         fc = params["fc"]
         q = params.get("q", 10)
         r = params.get("r", 100)
         include_source = params.get("include_source", True)
 
-        values = self.calculate_values(fc=fc, q=q, r=r)
+        values = self._compute(fc, q, r)
 
         circuit = Circuit(f"RLC Notch Filter (fc={fc}Hz, Q={q})")
 
@@ -322,13 +352,15 @@ class RLCNotchTemplate(CircuitTemplate):
             circuit.add_voltage_source("V1", "in", "0", ac=1)
 
         # Series R with parallel LC to ground
-        circuit.add_resistor("R1", "in", "out", format_value(values["r"], "R"))
-        circuit.add_inductor("L1", "out", "0", format_value(values["l"], "L"))
-        circuit.add_capacitor("C1", "out", "0", format_value(values["c"], "C"))
+        circuit.add_components(
+            [
+                ("R1", "in", "out", format_value(values["r"], "R")),
+                ("L1", "out", "0", format_value(values["l"], "L")),
+                ("C1", "out", "0", format_value(values["c"], "C")),
+            ]
+        )
 
-        bw = fc / q
-        start_freq = max(1, fc - 5 * bw)
-        stop_freq = fc + 5 * bw
+        start_freq, stop_freq = _rlc_sweep(fc, q)
         circuit.add_ac_analysis(start=start_freq, stop=stop_freq, points_per_decade=50)
 
         return circuit
@@ -344,7 +376,7 @@ _rlc_notch_template = RLCNotchTemplate()
 # Factory functions (convenient API)
 def rc_lowpass(
     fc: float, r: float | None = None, c: float | None = None, include_source: bool = True
-) -> Circuit:
+) -> "Circuit":
     """Create an RC Low-Pass Filter.
 
     Args:
@@ -360,12 +392,12 @@ def rc_lowpass(
         >>> circuit = rc_lowpass(fc=1000, r=1000)
         >>> print(circuit.to_netlist())
     """
-    return _rc_lowpass_template.create(fc=fc, r=r, c=c, include_source=include_source)
+    return _rc_lowpass_template.create_cached(fc=fc, r=r, c=c, include_source=include_source)
 
 
 def rc_highpass(
     fc: float, r: float | None = None, c: float | None = None, include_source: bool = True
-) -> Circuit:
+) -> "Circuit":
     """Create an RC High-Pass Filter.
 
     Args:
@@ -381,10 +413,12 @@ def rc_highpass(
         >>> circuit = rc_highpass(fc=1000, r=1000)
         >>> print(circuit.to_netlist())
     """
-    return _rc_highpass_template.create(fc=fc, r=r, c=c, include_source=include_source)
+    return _rc_highpass_template.create_cached(fc=fc, r=r, c=c, include_source=include_source)
 
 
-def rlc_bandpass(fc: float, q: float = 10, r: float = 100, include_source: bool = True) -> Circuit:
+def rlc_bandpass(
+    fc: float, q: float = 10, r: float = 100, include_source: bool = True
+) -> "Circuit":
     """Create an RLC Bandpass Filter.
 
     Args:
@@ -400,10 +434,10 @@ def rlc_bandpass(fc: float, q: float = 10, r: float = 100, include_source: bool
         >>> circuit = rlc_bandpass(fc=1000, q=10)
         >>> print(circuit.to_netlist())
     """
-    return _rlc_bandpass_template.create(fc=fc, q=q, r=r, include_source=include_source)
+    return _rlc_bandpass_template.create_cached(fc=fc, q=q, r=r, include_source=include_source)
 
 
-def rlc_notch(fc: float, q: float = 10, r: float = 100, include_source: bool = True) -> Circuit:
+def rlc_notch(fc: float, q: float = 10, r: float = 100, include_source: bool = True) -> "Circuit":
     """Create an RLC Notch (Band-Stop) Filter.
 
     Args:
@@ -419,22 +453,28 @@ def rlc_notch(fc: float, q: float = 10, r: float = 100, include_source: bool = T
         >>> circuit = rlc_notch(fc=60, q=20)  # 60Hz hum filter
         >>> print(circuit.to_netlist())
     """
-    return _rlc_notch_template.create(fc=fc, q=q, r=r, include_source=include_source)
+    return _rlc_notch_template.create_cached(fc=fc, q=q, r=r, include_source=include_source)
 
 
 # Registry of all filter templates
-FILTER_TEMPLATES: dict[str, CircuitTemplate] = {
-    "rc_lowpass": _rc_lowpass_template,
-    "rc_highpass": _rc_highpass_template,
-    "rlc_bandpass": _rlc_bandpass_template,
-    "rlc_notch": _rlc_notch_template,
-}
+FILTER_TEMPLATES: Mapping[str, CircuitTemplate] = MappingProxyType(
+    {
+        "rc_lowpass": _rc_lowpass_template,
+        "rc_highpass": _rc_highpass_template,
+        "rlc_bandpass": _rlc_bandpass_template,
+        "rlc_notch": _rlc_notch_template,
+    }
+)
+
+
+# Template metadata is static, so list_templates() returns a precomputed tuple
+_FILTER_INFOS: tuple[TemplateInfo, ...] = tuple(t.info() for t in FILTER_TEMPLATES.values())
 
 
-def list_templates() -> list[TemplateInfo]:
+def list_templates() -> tuple[TemplateInfo, ...]:
     """List all available filter templates.
 
     Returns:
-        List of TemplateInfo for each filter template.
+        Tuple of TemplateInfo for each filter template.
     """
-    return [template.info() for template in FILTER_TEMPLATES.values()]
+    return _FILTER_INFOS
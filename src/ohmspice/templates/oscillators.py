@@ -15,13 +15,67 @@ Example:
     >>> print(circuit.to_netlist())
 """
 
+import functools
 import math
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from ohmspice.circuit import Circuit
-from ohmspice.components.utils import format_value
 from ohmspice.templates.base import CircuitTemplate, TemplateInfo, TemplateParameter
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from ohmspice.circuit import Circuit
+
+_TWO_PI = 2 * math.pi
+_SQRT_6 = math.sqrt(6)
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _wien_values(frequency: float, r: float) -> tuple[float, float]:
+    """Return (R, C) for a Wien bridge network."""
+    # f = 1 / (2π * R * C) => C = 1 / (2π * R * f)
+    return r, 1 / (_TWO_PI * r * frequency)
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _phase_shift_values(frequency: float, r: float) -> tuple[float, float]:
+    """Return (R, C) for a 3-stage phase shift network."""
+    # f = 1 / (2π * R * C * √6) => C = 1 / (2π * R * f * √6)
+    return r, 1 / (_TWO_PI * r * frequency * _SQRT_6)
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _colpitts_values(
+    frequency: float, inductance: float | None, c_ratio: float
+) -> tuple[float, float, float]:
+    """Return (L, C1, C2) for a Colpitts tank."""
+    omega = _TWO_PI * frequency
+
+    if inductance is None:
+        # Choose reasonable L value based on frequency
+        # For audio, use mH range; for RF, use µH range
+        if frequency < 1000:
+            inductance = 0.1  # 100mH
+        elif frequency < 1e6:
+            inductance = 1e-3  # 1mH
+        else:
+            inductance = 1e-6  # 1µH
+
+    # Ceq = 1 / (ω² * L)
+    c_eq = 1 / (omega * omega * inductance)
+
+    # C1*C2/(C1+C2) = Ceq
+    # With C1 = ratio * C2:
+    # ratio*C2*C2 / ((ratio+1)*C2) = Ceq
+    # ratio*C2 / (ratio+1) = Ceq
+    # C2 = Ceq * (ratio+1) / ratio
+    c2 = c_eq * (c_ratio + 1) / c_ratio
+    c1 = c_ratio * c2
+
+    return inductance, c1, c2
+
 
 class WienBridgeTemplate(CircuitTemplate):
     """Wien Bridge Oscillator template.
@@ -34,6 +88,7 @@ class WienBridgeTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="wien_bridge",
@@ -56,43 +111,46 @@ class WienBridgeTemplate(CircuitTemplate):
         Returns:
             Dictionary with 'r' and 'c' values.
         """
-        frequency = specs["frequency"]
-        r = specs.get("r", 10000)
-
-        # f = 1 / (2π * R * C) => C = 1 / (2π * R * f)
-        c = 1 / (2 * math.pi * r * frequency)
-
+        r, c = _wien_values(specs["frequency"], specs.get("r", 10000))
         return {"r": r, "c": c}
 
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create Wien Bridge Oscillator network.
 
         Creates the frequency-determining RC network.
         Full oscillator requires additional gain stage.
         """
         frequency = params["frequency"]
-        r = params.get("r", 10000)
-        include_source = params.get("include_source", True)
+        r, c = _wien_values(frequency, params.get("r", 10000))
+        return self._build(frequency, r, c, params.get("include_source", True))
 
-        values = self.calculate_values(frequency=frequency, r=r)
+    @staticmethod
+    def _build(frequency: float, r: float, c: float, include_source: bool) -> "Circuit":
+        """Build the network from precomputed component values."""
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
 
         circuit = Circuit(f"Wien Bridge Network ({frequency}Hz)")
 
         if include_source:
             circuit.add_voltage_source("V1", "in", "0", ac=1)
 
-        # Series RC branch
-        circuit.add_resistor("R1", "in", "mid", format_value(values["r"], "R"))
-        circuit.add_capacitor("C1", "mid", "out", format_value(values["c"], "C"))
-
-        # Parallel RC branch to ground
-        circuit.add_resistor("R2", "out", "0", format_value(values["r"], "R"))
-        circuit.add_capacitor("C2", "out", "0", format_value(values["c"], "C"))
+        r_fmt = format_value(r, "R")
+        c_fmt = format_value(c, "C")
+
+        circuit.add_components(
+            [
+                # Series RC branch
+                ("R1", "in", "mid", r_fmt),
+                ("C1", "mid", "out", c_fmt),
+                # Parallel RC branch to ground
+                ("R2", "out", "0", r_fmt),
+                ("C2", "out", "0", c_fmt),
+            ]
+        )
 
-        # AC analysis around oscillation frequency
-        start_freq = frequency / 10
-        stop_freq = frequency * 10
-        circuit.add_ac_analysis(start=start_freq, stop=stop_freq, points_per_decade=50)
+        # AC analysis one decade either side of the oscillation frequency
+        circuit.add_ac_analysis_decade(frequency, points_per_decade=50)
 
         return circuit
 
@@ -106,6 +164,7 @@ class PhaseShiftTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="phase_shift",
@@ -128,25 +187,24 @@ class PhaseShiftTemplate(CircuitTemplate):
         Returns:
             Dictionary with 'r' and 'c' values.
         """
-        frequency = specs["frequency"]
-        r = specs.get("r", 10000)
-
-        # f = 1 / (2π * R * C * √6) => C = 1 / (2π * R * f * √6)
-        c = 1 / (2 * math.pi * r * frequency * math.sqrt(6))
-
+        r, c = _phase_shift_values(specs["frequency"], specs.get("r", 10000))
         return {"r": r, "c": c}
 
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create Phase Shift Oscillator network.
 
         Creates the 3-stage RC phase shift network.
         Full oscillator requires additional gain stage with gain = 29.
         """
         frequency = params["frequency"]
-        r = params.get("r", 10000)
-        include_source = params.get("include_source", True)
+        r, c = _phase_shift_values(frequency, params.get("r", 10000))
+        return self._build(frequency, r, c, params.get("include_source", True))
 
-        values = self.calculate_values(frequency=frequency, r=r)
+    @staticmethod
+    def _build(frequency: float, r: float, c: float, include_source: bool) -> "Circuit":
+        """Build the network from precomputed component values."""
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
 
         circuit = Circuit(f"Phase Shift Network ({frequency}Hz)")
 
@@ -154,24 +212,25 @@ class PhaseShiftTemplate(CircuitTemplate):
             circuit.add_voltage_source("V1", "in", "0", ac=1)
 
         # 3-stage RC network (each stage provides 60° phase shift at fc)
-        r_fmt = format_value(values["r"], "R")
-        c_fmt = format_value(values["c"], "C")
-
-        # Stage 1
-        circuit.add_capacitor("C1", "in", "n1", c_fmt)
-        circuit.add_resistor("R1", "n1", "0", r_fmt)
-
-        # Stage 2
-        circuit.add_capacitor("C2", "n1", "n2", c_fmt)
-        circuit.add_resistor("R2", "n2", "0", r_fmt)
-
-        # Stage 3
-        circuit.add_capacitor("C3", "n2", "out", c_fmt)
-        circuit.add_resistor("R3", "out", "0", r_fmt)
+        r_fmt = format_value(r, "R")
+        c_fmt = format_value(c, "C")
+
+        circuit.add_components(
+            [
+                # Stage 1
+                ("C1", "in", "n1", c_fmt),
+                ("R1", "n1", "0", r_fmt),
+                # Stage 2
+                ("C2", "n1", "n2", c_fmt),
+                ("R2", "n2", "0", r_fmt),
+                # Stage 3
+                ("C3", "n2", "out", c_fmt),
+                ("R3", "out", "0", r_fmt),
+            ]
+        )
 
-        start_freq = frequency / 10
-        stop_freq = frequency * 10
-        circuit.add_ac_analysis(start=start_freq, stop=stop_freq, points_per_decade=50)
+        # AC analysis one decade either side of the oscillation frequency
+        circuit.add_ac_analysis_decade(frequency, points_per_decade=50)
 
         return circuit
 
@@ -185,6 +244,7 @@ class ColpittsTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="colpitts",
@@ -209,47 +269,28 @@ class ColpittsTemplate(CircuitTemplate):
         Returns:
             Dictionary with 'l', 'c1', 'c2' values.
         """
-        frequency = specs["frequency"]
-        inductance = specs.get("l")
-        c_ratio = specs.get("c_ratio", 1)
-
-        omega = 2 * math.pi * frequency
-
-        if inductance is None:
-            # Choose reasonable L value based on frequency
-            # For audio, use mH range; for RF, use µH range
-            if frequency < 1000:
-                inductance = 0.1  # 100mH
-            elif frequency < 1e6:
-                inductance = 1e-3  # 1mH
-            else:
-                inductance = 1e-6  # 1µH
-
-        # Ceq = 1 / (ω² * L)
-        c_eq = 1 / (omega * omega * inductance)
-
-        # C1*C2/(C1+C2) = Ceq
-        # With C1 = ratio * C2:
-        # ratio*C2*C2 / ((ratio+1)*C2) = Ceq
-        # ratio*C2 / (ratio+1) = Ceq
-        # C2 = Ceq * (ratio+1) / ratio
-        c2 = c_eq * (c_ratio + 1) / c_ratio
-        c1 = c_ratio * c2
-
+        inductance, c1, c2 = _colpitts_values(
+            specs["frequency"], specs.get("l"), specs.get("c_ratio", 1)
+        )
         return {"l": inductance, "c1": c1, "c2": c2}
 
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create Colpitts Oscillator network.
 
         Creates the LC tank circuit with capacitive divider.
         Full oscillator requires active device (transistor/FET).
         """
         frequency = params["frequency"]
-        inductance = params.get("l")
-        c_ratio = params.get("c_ratio", 1)
-        include_source = params.get("include_source", True)
+        inductance, c1, c2 = _colpitts_values(frequency, params.get("l"), params.get("c_ratio", 1))
+        return self._build(frequency, inductance, c1, c2, params.get("include_source", True))
 
-        values = self.calculate_values(frequency=frequency, l=inductance, c_ratio=c_ratio)
+    @staticmethod
+    def _build(
+        frequency: float, inductance: float, c1: float, c2: float, include_source: bool
+    ) -> "Circuit":
+        """Build the tank from precomputed component values."""
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
 
         circuit = Circuit(f"Colpitts Tank ({frequency}Hz)")
 
@@ -257,13 +298,16 @@ class ColpittsTemplate(CircuitTemplate):
             circuit.add_voltage_source("V1", "in", "0", ac=1)
 
         # LC tank with capacitive divider
-        circuit.add_inductor("L1", "in", "tap", format_value(values["l"], "L"))
-        circuit.add_capacitor("C1", "in", "tap", format_value(values["c1"], "C"))
-        circuit.add_capacitor("C2", "tap", "0", format_value(values["c2"], "C"))
+        circuit.add_components(
+            [
+                ("L1", "in", "tap", format_value(inductance, "L")),
+                ("C1", "in", "tap", format_value(c1, "C")),
+                ("C2", "tap", "0", format_value(c2, "C")),
+            ]
+        )
 
-        start_freq = frequency / 10
-        stop_freq = frequency * 10
-        circuit.add_ac_analysis(start=start_freq, stop=stop_freq, points_per_decade=50)
+        # AC analysis one decade either side of the oscillation frequency
+        circuit.add_ac_analysis_decade(frequency, points_per_decade=50)
 
         return circuit
 
@@ -275,7 +319,7 @@ _colpitts_template = ColpittsTemplate()
 
 
 # Factory functions
-def wien_bridge(frequency: float, r: float = 10000, include_source: bool = True) -> Circuit:
+def wien_bridge(frequency: float, r: float = 10000, include_source: bool = True) -> "Circuit":
     """Create a Wien Bridge Oscillator network.
 
     Args:
@@ -290,10 +334,12 @@ def wien_bridge(frequency: float, r: float = 10000, include_source: bool = True)
         >>> circuit = wien_bridge(frequency=1000)
         >>> print(circuit.to_netlist())
     """
-    return _wien_bridge_template.create(frequency=frequency, r=r, include_source=include_source)
+    return _wien_bridge_template.create_cached(
+        frequency=frequency, r=r, include_source=include_source
+    )
 
 
-def phase_shift(frequency: float, r: float = 10000, include_source: bool = True) -> Circuit:
+def phase_shift(frequency: float, r: float = 10000, include_source: bool = True) -> "Circuit":
     """Create a Phase Shift Oscillator network.
 
     Args:
@@ -308,7 +354,9 @@ def phase_shift(frequency: float, r: float = 10000, include_source: bool = True)
         >>> circuit = phase_shift(frequency=1000)
         >>> print(circuit.to_netlist())
     """
-    return _phase_shift_template.create(frequency=frequency, r=r, include_source=include_source)
+    return _phase_shift_template.create_cached(
+        frequency=frequency, r=r, include_source=include_source
+    )
 
 
 def colpitts(
@@ -316,7 +364,7 @@ def colpitts(
     inductance: float | None = None,
     c_ratio: float = 1,
     include_source: bool = True,
-) -> Circuit:
+) -> "Circuit":
     """Create a Colpitts Oscillator network.
 
     Args:
@@ -332,7 +380,7 @@ def colpitts(
         >>> circuit = colpitts(frequency=1e6)  # 1 MHz oscillator
         >>> print(circuit.to_netlist())
     """
-    return _colpitts_template.create(
+    return _colpitts_template.create_cached(
         frequency=frequency,
         l=inductance,
         c_ratio=c_ratio,
@@ -340,14 +388,118 @@ def colpitts(
     )
 
 
+# Batch factory functions
+def _frequency_array(frequencies: "npt.ArrayLike") -> Any:
+    """Return frequencies as a flat float64 array."""
+    import numpy as np
+
+    return np.asarray(frequencies, dtype=np.float64).ravel()
+
+
+def wien_bridge_batch(
+    frequencies: "npt.ArrayLike", r: float = 10000, include_source: bool = True
+) -> list["Circuit"]:
+    """Create a Wien Bridge Oscillator network for each frequency.
+
+    Capacitor values for the whole sweep are computed in one vectorized
+    step; the netlists match those from :func:`wien_bridge` with float
+    frequencies.
+
+    Args:
+        frequencies: Oscillation frequencies in Hz.
+        r: Resistance in Ohms (default 10kΩ).
+        include_source: Include AC voltage source (default True).
+
+    Returns:
+        List of configured Circuits, one per frequency.
+
+    Example:
+        >>> circuits = wien_bridge_batch([500.0, 1000.0, 2000.0])
+    """
+    freqs = _frequency_array(frequencies)
+    # C = 1 / (2π * R * f)
+    caps = 1 / (_TWO_PI * r * freqs)
+    build = WienBridgeTemplate._build
+    return [
+        build(f, r, c, include_source) for f, c in zip(freqs.tolist(), caps.tolist(), strict=True)
+    ]
+
+
+def phase_shift_batch(
+    frequencies: "npt.ArrayLike", r: float = 10000, include_source: bool = True
+) -> list["Circuit"]:
+    """Create a Phase Shift Oscillator network for each frequency.
+
+    Args:
+        frequencies: Oscillation frequencies in Hz.
+        r: Resistance in Ohms (default 10kΩ).
+        include_source: Include AC voltage source (default True).
+
+    Returns:
+        List of configured Circuits, one per frequency.
+    """
+    freqs = _frequency_array(frequencies)
+    # C = 1 / (2π * R * f * √6)
+    caps = 1 / (_TWO_PI * r * freqs * _SQRT_6)
+    build = PhaseShiftTemplate._build
+    return [
+        build(f, r, c, include_source) for f, c in zip(freqs.tolist(), caps.tolist(), strict=True)
+    ]
+
+
+def colpitts_batch(
+    frequencies: "npt.ArrayLike",
+    inductance: float | None = None,
+    c_ratio: float = 1,
+    include_source: bool = True,
+) -> list["Circuit"]:
+    """Create a Colpitts Oscillator network for each frequency.
+
+    Args:
+        frequencies: Oscillation frequencies in Hz.
+        inductance: Inductance in Henries (optional, auto-calculated per frequency).
+        c_ratio: C1/C2 ratio (default 1 for equal capacitors).
+        include_source: Include AC voltage source (default True).
+
+    Returns:
+        List of configured Circuits, one per frequency.
+    """
+    import numpy as np
+
+    freqs = _frequency_array(frequencies)
+    if inductance is None:
+        # Same ranges as the single-circuit template
+        inductances = np.where(freqs < 1000, 0.1, np.where(freqs < 1e6, 1e-3, 1e-6))
+    else:
+        inductances = np.full_like(freqs, inductance)
+
+    omega = _TWO_PI * freqs
+    c2 = 1 / (omega * omega * inductances) * (c_ratio + 1) / c_ratio
+    c1 = c_ratio * c2
+
+    build = ColpittsTemplate._build
+    return [
+        build(f, l_val, c1_val, c2_val, include_source)
+        for f, l_val, c1_val, c2_val in zip(
+            freqs.tolist(), inductances.tolist(), c1.tolist(), c2.tolist(), strict=True
+        )
+    ]
+
+
 # Registry
-OSCILLATOR_TEMPLATES: dict[str, CircuitTemplate] = {
-    "wien_bridge": _wien_bridge_template,
-    "phase_shift": _phase_shift_template,
-    "colpitts": _colpitts_template,
-}
+OSCILLATOR_TEMPLATES: Mapping[str, CircuitTemplate] = MappingProxyType(
+    {
+        "wien_bridge": _wien_bridge_template,
+        "phase_shift": _phase_shift_template,
+        "colpitts": _colpitts_template,
+    }
+)
+
+
+# Template metadata is static, so list_templates() returns a precomputed tuple
+_OSCILLATOR_INFOS: tuple[TemplateInfo, ...] = tuple(t.info() for t in OSCILLATOR_TEMPLATES.values())
 
 
-def list_templates() -> list[TemplateInfo]:
+def list_templates() -> tuple[TemplateInfo, ...]:
     """List all available oscillator templates."""
-    return [template.info() for template in OSCILLATOR_TEMPLATES.values()]
+    return _OSCILLATOR_INFOS
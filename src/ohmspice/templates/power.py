@@ -11,12 +11,16 @@ Example:
     >>> print(circuit.to_netlist())
 """
 
-from typing import Any
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-from ohmspice.circuit import Circuit
-from ohmspice.components.utils import format_value
 from ohmspice.templates.base import CircuitTemplate, TemplateInfo, TemplateParameter
 
+if TYPE_CHECKING:
+    from ohmspice.circuit import Circuit
+
 
 class VoltageDividerTemplate(CircuitTemplate):
     """Voltage Divider template.
@@ -29,6 +33,7 @@ class VoltageDividerTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="voltage_divider",
@@ -69,8 +74,11 @@ class VoltageDividerTemplate(CircuitTemplate):
 
         return {"r1": r1, "r2": r2}
 
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create Voltage Divider circuit."""
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
+
         vout = params["vout"]
         vin = params["vin"]
         r2 = params.get("r2", 10000)
@@ -83,8 +91,12 @@ class VoltageDividerTemplate(CircuitTemplate):
         if include_source:
             circuit.add_voltage_source("V1", "in", "0", dc=vin)
 
-        circuit.add_resistor("R1", "in", "out", format_value(values["r1"], "R"))
-        circuit.add_resistor("R2", "out", "0", format_value(values["r2"], "R"))
+        circuit.add_components(
+            [
+                ("R1", "in", "out", format_value(values["r1"], "R")),
+                ("R2", "out", "0", format_value(values["r2"], "R")),
+            ]
+        )
 
         # DC analysis to verify divider ratio
         circuit.add_op_analysis()
@@ -102,6 +114,7 @@ class HalfWaveRectifierTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="half_wave_rectifier",
@@ -146,11 +159,14 @@ class HalfWaveRectifierTemplate(CircuitTemplate):
             "filter_c": filter_c,
         }
 
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create Half Wave Rectifier circuit.
 
         Note: Uses simplified model until Diode component is available.
         """
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
+
         frequency = params.get("frequency", 60)
         load_r = params.get("load_r", 1000)
         filter_c = params.get("filter_c")
@@ -162,9 +178,7 @@ class HalfWaveRectifierTemplate(CircuitTemplate):
 
         if include_source:
             # AC sine source
-            circuit.add_voltage_source(
-                "V1", "in", "0", sine={"offset": 0, "amplitude": 10, "frequency": frequency}
-            )
+            circuit.add_voltage_source("V1", "in", "0", sine={"vo": 0, "va": 10, "freq": frequency})
 
         # TODO: Add diode when Diode component is implemented
         # For now, just add load and filter
@@ -189,6 +203,7 @@ class FullWaveRectifierTemplate(CircuitTemplate):
     """
 
     @classmethod
+    @functools.cache
     def info(cls) -> TemplateInfo:
         return TemplateInfo(
             name="full_wave_rectifier",
@@ -222,8 +237,11 @@ class FullWaveRectifierTemplate(CircuitTemplate):
             "filter_c": filter_c,
         }
 
-    def create(self, **params: Any) -> Circuit:
+    def create(self, **params: Any) -> "Circuit":
         """Create Full Wave Rectifier circuit."""
+        from ohmspice.circuit import Circuit
+        from ohmspice.components.utils import format_value
+
         frequency = params.get("frequency", 60)
         load_r = params.get("load_r", 1000)
         filter_c = params.get("filter_c")
@@ -234,9 +252,7 @@ class FullWaveRectifierTemplate(CircuitTemplate):
         circuit = Circuit(f"Full Wave Rectifier ({frequency}Hz)")
 
         if include_source:
-            circuit.add_voltage_source(
-                "V1", "in", "0", sine={"offset": 0, "amplitude": 10, "frequency": frequency}
-            )
+            circuit.add_voltage_source("V1", "in", "0", sine={"vo": 0, "va": 10, "freq": frequency})
 
         # TODO: Add diode bridge when Diode component is implemented
         circuit.add_resistor("Rload", "out", "0", format_value(values["load_r"], "R"))
@@ -259,7 +275,7 @@ _full_wave_rectifier_template = FullWaveRectifierTemplate()
 # Factory functions
 def voltage_divider(
     vout: float, vin: float, r2: float = 10000, include_source: bool = True
-) -> Circuit:
+) -> "Circuit":
     """Create a Voltage Divider.
 
     Args:
@@ -275,7 +291,7 @@ def voltage_divider(
         >>> circuit = voltage_divider(vout=3.3, vin=5)
         >>> print(circuit.to_netlist())
     """
-    return _voltage_divider_template.create(
+    return _voltage_divider_template.create_cached(
         vout=vout, vin=vin, r2=r2, include_source=include_source
     )
 
@@ -285,7 +301,7 @@ def half_wave_rectifier(
     load_r: float = 1000,
     filter_c: float | None = None,
     include_source: bool = True,
-) -> Circuit:
+) -> "Circuit":
     """Create a Half Wave Rectifier.
 
     Args:
@@ -297,7 +313,7 @@ def half_wave_rectifier(
     Returns:
         Configured Circuit.
     """
-    return _half_wave_rectifier_template.create(
+    return _half_wave_rectifier_template.create_cached(
         frequency=frequency, load_r=load_r, filter_c=filter_c, include_source=include_source
     )
 
@@ -307,7 +323,7 @@ def full_wave_rectifier(
     load_r: float = 1000,
     filter_c: float | None = None,
     include_source: bool = True,
-) -> Circuit:
+) -> "Circuit":
     """Create a Full Wave Rectifier.
 
     Args:
@@ -319,19 +335,25 @@ def full_wave_rectifier(
     Returns:
         Configured Circuit.
     """
-    return _full_wave_rectifier_template.create(
+    return _full_wave_rectifier_template.create_cached(
         frequency=frequency, load_r=load_r, filter_c=filter_c, include_source=include_source
     )
 
 
 # Registry
-POWER_TEMPLATES: dict[str, CircuitTemplate] = {
-    "voltage_divider": _voltage_divider_template,
-    "half_wave_rectifier": _half_wave_rectifier_template,
-    "full_wave_rectifier": _full_wave_rectifier_template,
-}
+POWER_TEMPLATES: Mapping[str, CircuitTemplate] = MappingProxyType(
+    {
+        "voltage_divider": _voltage_divider_template,
+        "half_wave_rectifier": _half_wave_rectifier_template,
+        "full_wave_rectifier": _full_wave_rectifier_template,
+    }
+)
+
+
+# Template metadata is static, so list_templates() returns a precomputed tuple
+_POWER_INFOS: tuple[TemplateInfo, ...] = tuple(t.info() for t in POWER_TEMPLATES.values())
 
 
-def list_templates() -> list[TemplateInfo]:
+def list_templates() -> tuple[TemplateInfo, ...]:
     """List all available power templates."""
-    return [template.info() for template in POWER_TEMPLATES.values()]
+    return _POWER_INFOS
@@ -3,6 +3,23 @@
 import pytest
 
 
+def pytest_addoption(parser):
+    """Add the --run-slow option."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False, help="run tests marked as slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
 @pytest.fixture
 def sample_circuit_data():
     """Sample circuit data for testing."""
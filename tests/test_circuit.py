@@ -1,8 +1,24 @@
 """Tests for Circuit class."""
 
+import io
+
 import pytest
 
 from ohmspice import Circuit
+from ohmspice.components import Component
+
+
+class Diode(Component):
+    """Component subclass written against the public to_spice() hook."""
+
+    PREFIX = "D"
+
+    def __init__(self, name, node1, node2, model):
+        super().__init__(name, node1, node2)
+        self.model = model
+
+    def to_spice(self):
+        return f"{self.name} {self.node1} {self.node2} {self.model}"
 
 
 class TestCircuitCreation:
@@ -19,6 +35,21 @@ class TestCircuitCreation:
         assert "Circuit" in repr(circuit)
         assert "Test" in repr(circuit)
 
+    def test_copy_is_independent(self):
+        circuit = Circuit("Test")
+        circuit.add_voltage_source("V1", "in", "0", sine={"va": 1, "freq": 50})
+        circuit.add_capacitor("C1", "in", "0", "1u", initial_voltage=2.0)
+        circuit.add_transient_analysis(stop_time=1e-3, step_time=1e-6)
+
+        clone = circuit.copy()
+        assert clone.to_netlist() == circuit.to_netlist()
+
+        clone.get_component("C1").value_str = "2u"
+        clone.add_resistor("R1", "in", "0", "1k")
+        assert "C1 in 0 1u IC=2.0" in circuit.to_netlist()
+        assert len(circuit) == 2
+        assert clone.get_component("C1") is clone.components[1]
+
 
 class TestAddComponents:
     """Tests for adding components."""
@@ -49,6 +80,25 @@ class TestAddComponents:
         circuit.add_current_source("I1", "in", "0", dc=0.001)
         assert len(circuit) == 1
 
+    def test_add_by_prefix(self):
+        circuit = Circuit("Test")
+        circuit.add("V1", "in", "0", ac=1).add("R1", "in", "out", "1k").add("C1", "out", "0", "1u")
+        assert [type(c).__name__ for c in circuit.components] == [
+            "VoltageSource",
+            "Resistor",
+            "Capacitor",
+        ]
+        assert circuit.components[1].to_spice() == "R1 in out 1k"
+        with pytest.raises(ValueError, match="Unknown component type"):
+            circuit.add("Q1", "c", "b", "e")
+
+    def test_add_components(self):
+        circuit = Circuit("Test")
+        circuit.add_components([("R1", "in", "out", "1k"), ("L1", "out", "0", "1m")])
+        assert circuit.to_netlist().splitlines()[1:3] == ["R1 in out 1k", "L1 out 0 1m"]
+        with pytest.raises(ValueError, match="already exists"):
+            circuit.add_components([("C1", "out", "0", "1u"), ("R1", "a", "b", "2k")])
+
     def test_method_chaining(self):
         circuit = (
             Circuit("Test")
@@ -62,6 +112,23 @@ class TestAddComponents:
         circuit.add_resistor("R1", "in", "out", "1k")
         with pytest.raises(ValueError, match="already exists"):
             circuit.add_resistor("R1", "a", "b", "2k")
+        assert circuit.get_component("R1").value == 1000.0
+
+    def test_reset(self):
+        circuit = Circuit("Test")
+        circuit.add_resistor("R1", "in", "out", "1k").add_op_analysis()
+        assert circuit.reset("Other") is circuit
+        assert circuit.name == "Other"
+        assert len(circuit) == 0
+        assert circuit.analyses == []
+        circuit.add_resistor("R1", "a", "b", "2k")
+
+    def test_get_component(self):
+        circuit = Circuit("Test")
+        circuit.add_resistor("R1", "in", "out", "1k")
+        assert circuit.get_component("R1") is circuit.components[0]
+        with pytest.raises(KeyError):
+            circuit.get_component("R2")
 
 
 class TestAnalysis:
@@ -71,7 +138,28 @@ class TestAnalysis:
         circuit = Circuit("Test")
         circuit.add_ac_analysis(start=1, stop=1e6, points_per_decade=10)
         assert len(circuit.analyses) == 1
-        assert ".ac" in circuit.analyses[0]
+        assert circuit.analyses[0] == ".ac dec 10 1 1meg"
+
+    def test_add_ac_analysis_decade(self):
+        circuit = Circuit("Test")
+        circuit.add_ac_analysis_decade(1000, points_per_decade=50)
+        circuit.add_ac_analysis_decade(1e3, decades=2)
+        assert circuit.analyses == [".ac dec 50 100 10k", ".ac dec 10 10 100k"]
+
+    @pytest.mark.parametrize(
+        ("freq", "expected"),
+        [
+            (1, "1"),
+            (1.0, "1"),
+            (0.5, "0.5"),
+            (1e3, "1k"),
+            (2.5e6, "2.5meg"),
+            (1e9, "1g"),
+            (1234567.8, "1.2345678meg"),
+        ],
+    )
+    def test_format_frequency(self, freq, expected):
+        assert Circuit._format_frequency(freq) == expected
 
     def test_add_dc_analysis(self):
         circuit = Circuit("Test")
@@ -85,6 +173,19 @@ class TestAnalysis:
         assert len(circuit.analyses) == 1
         assert ".tran" in circuit.analyses[0]
 
+    def test_transient_analysis_with_step(self):
+        circuit = Circuit("Test")
+        circuit.add_transient_analysis(stop_time=1e-3, step_time=1e-6)
+        assert circuit.analyses == [".tran 1e-06 0.001 0"]
+
+    def test_analyses_list_editable(self):
+        circuit = Circuit("Test")
+        circuit.add_op_analysis()
+        circuit.analyses.append(".tran 1m")
+        assert circuit.to_netlist().splitlines()[-3:] == [".op", ".tran 1m", ".end"]
+        circuit.analyses.clear()
+        assert ".op" not in circuit.to_netlist()
+
     def test_add_op_analysis(self):
         circuit = Circuit("Test")
         circuit.add_op_analysis()
@@ -94,6 +195,21 @@ class TestAnalysis:
 class TestNetlistGeneration:
     """Tests for netlist generation."""
 
+    def test_subclass_to_spice_used(self):
+        circuit = Circuit("Test")
+        circuit.add_component(Diode("D1", "a", "0", "1N4148"))
+        assert "D1 a 0 1N4148" in circuit.to_netlist()
+
+    def test_subclass_attributes_copied(self):
+        circuit = Circuit("Test")
+        circuit.add_component(Diode("D1", "a", "0", "1N4148"))
+        assert "D1 n1 0 1N4148" in circuit.to_netlist(normalized=True)
+
+        clone = circuit.copy()
+        clone.get_component("D1").model = "1N914"
+        assert "D1 a 0 1N914" in clone.to_netlist()
+        assert "D1 a 0 1N4148" in circuit.to_netlist()
+
     def test_basic_netlist(self):
         circuit = Circuit("RC Filter")
         circuit.add_voltage_source("V1", "in", "0", ac=1)
@@ -110,6 +226,23 @@ class TestNetlistGeneration:
         assert ".ac" in netlist
         assert ".end" in netlist
 
+    def test_normalized_netlist(self):
+        a = Circuit("A")
+        a.add_capacitor("C1", "out", "0", "159n")
+        a.add_resistor("R1", "in", "out", "1k")
+        a.add_voltage_source("V1", "in", "gnd", ac=1)
+
+        b = Circuit("B")
+        b.add_voltage_source("V1", "src", "0", ac=1)
+        b.add_resistor("R1", "src", "mid", "1k")
+        b.add_capacitor("C1", "mid", "0", "159n")
+
+        lines = a.to_netlist(normalized=True).split("\n")
+        assert lines[1:] == b.to_netlist(normalized=True).split("\n")[1:]
+        assert lines[1:4] == ["V1 n1 0 AC 1", "R1 n1 n2 1k", "C1 n2 0 159n"]
+        # The circuit itself is unchanged
+        assert a.to_netlist().split("\n")[1] == "C1 out 0 159n"
+
     def test_netlist_ends_with_end(self):
         circuit = Circuit("Test")
         netlist = circuit.to_netlist()
@@ -125,6 +258,16 @@ class TestNetlistGeneration:
         assert filepath.exists()
         content = filepath.read_text()
         assert "R1 a b 1k" in content
+        assert content == circuit.to_netlist() + "\n"
+
+    def test_write_matches_netlist(self):
+        circuit = Circuit("Test")
+        circuit.add_resistor("R1", "a", "b", "1k")
+        circuit.add_op_analysis()
+
+        buffer = io.StringIO()
+        circuit.write(buffer)
+        assert buffer.getvalue() == circuit.to_netlist() + "\n"
 
 
 class TestRCLowPassFilter:
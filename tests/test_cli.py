@@ -1,16 +1,25 @@
 """Tests for CLI commands."""
 
+import subprocess
+import sys
+
+import pytest
 from click.testing import CliRunner
 
-from ohmspice.cli import main
+from ohmspice.cli import _get_all_templates, _get_template_by_name, main
+
+
+@pytest.fixture(scope="module")
+def runner() -> CliRunner:
+    """CLI runner shared by the tests in this module."""
+    return CliRunner()
 
 
 class TestCLI:
     """Tests for CLI commands."""
 
-    def test_main_help(self) -> None:
+    def test_main_help(self, runner: CliRunner) -> None:
         """Test main help command."""
-        runner = CliRunner()
         result = runner.invoke(main, ["--help"])
         assert result.exit_code == 0
         assert "OhmSPICE" in result.output
@@ -18,48 +27,52 @@ class TestCLI:
         assert "new" in result.output
         assert "simulate" in result.output
 
-    def test_version(self) -> None:
+    def test_version(self, runner: CliRunner) -> None:
         """Test version option."""
-        runner = CliRunner()
         result = runner.invoke(main, ["--version"])
         assert result.exit_code == 0
         assert "ohmspice" in result.output.lower()
 
-    def test_templates_command(self) -> None:
+    def test_templates_command(self, runner: CliRunner) -> None:
         """Test templates listing command."""
-        runner = CliRunner()
         result = runner.invoke(main, ["templates"])
         assert result.exit_code == 0
         assert "Filters" in result.output
         assert "rc_lowpass" in result.output
 
-    def test_templates_verbose(self) -> None:
+    def test_templates_verbose(self, runner: CliRunner) -> None:
         """Test templates with verbose flag."""
-        runner = CliRunner()
         result = runner.invoke(main, ["templates", "-v"])
         assert result.exit_code == 0
         assert "Parameters" in result.output
 
-    def test_templates_category_filter(self) -> None:
+    def test_templates_category_filter(self, runner: CliRunner) -> None:
         """Test filtering templates by category."""
-        runner = CliRunner()
         result = runner.invoke(main, ["templates", "-c", "filters"])
         assert result.exit_code == 0
         assert "Filters" in result.output
         assert "Amplifiers" not in result.output
 
-    def test_new_lowpass(self) -> None:
+    def test_templates_category_imports_only_that_category(self) -> None:
+        """Test that listing one category does not import the others."""
+        code = (
+            "import sys; from ohmspice.cli import main; "
+            "main(['templates', '-c', 'filters'], standalone_mode=False); "
+            "sys.exit('ohmspice.templates.amplifiers' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True)
+        assert result.returncode == 0
+
+    def test_new_lowpass(self, runner: CliRunner) -> None:
         """Test creating lowpass filter."""
-        runner = CliRunner()
         result = runner.invoke(main, ["new", "lowpass", "--fc", "1000", "--r", "1k"])
         assert result.exit_code == 0
         assert "RC Low-Pass Filter" in result.output
         assert "R1" in result.output
         assert "C1" in result.output
 
-    def test_new_with_output_file(self) -> None:
+    def test_new_with_output_file(self, runner: CliRunner) -> None:
         """Test creating circuit with output file."""
-        runner = CliRunner()
         with runner.isolated_filesystem():
             result = runner.invoke(main, ["new", "lowpass", "--fc", "1000", "-o", "test.cir"])
             assert result.exit_code == 0
@@ -69,30 +82,32 @@ class TestCLI:
                 content = f.read()
                 assert "RC Low-Pass Filter" in content
 
-    def test_new_missing_params(self) -> None:
+    def test_new_missing_params(self, runner: CliRunner) -> None:
         """Test new command with missing required parameters."""
-        runner = CliRunner()
         result = runner.invoke(main, ["new", "lowpass"])
         assert result.exit_code != 0
         assert "Error" in result.output or "Missing" in result.output
 
-    def test_new_invalid_template(self) -> None:
+    def test_new_invalid_template(self, runner: CliRunner) -> None:
         """Test new command with invalid template name."""
-        runner = CliRunner()
         result = runner.invoke(main, ["new", "nonexistent", "--fc", "1000"])
         assert result.exit_code != 0
         assert "not found" in result.output
 
-    def test_new_voltage_divider(self) -> None:
+    def test_template_aliases(self) -> None:
+        """Test that aliases and names resolve to the same cached template."""
+        assert _get_template_by_name("Lowpass") is _get_template_by_name("rc_lowpass")
+        assert _get_template_by_name("notch") is not None
+        assert _get_all_templates() is _get_all_templates()
+
+    def test_new_voltage_divider(self, runner: CliRunner) -> None:
         """Test creating voltage divider."""
-        runner = CliRunner()
         result = runner.invoke(main, ["new", "voltage_divider", "--vout", "3.3", "--vin", "5"])
         assert result.exit_code == 0
         assert "Voltage Divider" in result.output
 
-    def test_schematic_not_implemented(self) -> None:
+    def test_schematic_not_implemented(self, runner: CliRunner) -> None:
         """Test schematic command shows not implemented message."""
-        runner = CliRunner()
         with runner.isolated_filesystem():
             # Create a test file
             with open("test.cir", "w") as f:
@@ -106,23 +121,20 @@ class TestCLI:
 class TestInteractiveMode:
     """Tests for interactive mode."""
 
-    def test_interactive_exit(self) -> None:
+    def test_interactive_exit(self, runner: CliRunner) -> None:
         """Test exiting interactive mode."""
-        runner = CliRunner()
         result = runner.invoke(main, ["interactive"], input="exit\n")
         assert result.exit_code == 0
         assert "Goodbye" in result.output
 
-    def test_interactive_help(self) -> None:
+    def test_interactive_help(self, runner: CliRunner) -> None:
         """Test help command in interactive mode."""
-        runner = CliRunner()
         result = runner.invoke(main, ["interactive"], input="help\nexit\n")
         assert result.exit_code == 0
         assert "Commands" in result.output
 
-    def test_interactive_new_circuit(self) -> None:
+    def test_interactive_new_circuit(self, runner: CliRunner) -> None:
         """Test creating circuit in interactive mode."""
-        runner = CliRunner()
         commands = "new My Circuit\nadd resistor R1 in out 1k\nshow\nexit\n"
         result = runner.invoke(main, ["interactive"], input=commands)
         assert result.exit_code == 0
@@ -130,9 +142,8 @@ class TestInteractiveMode:
         assert "Added resistor R1" in result.output
         assert "R1 in out 1k" in result.output
 
-    def test_interactive_full_circuit(self) -> None:
+    def test_interactive_full_circuit(self, runner: CliRunner) -> None:
         """Test building complete circuit in interactive mode."""
-        runner = CliRunner()
         commands = """new RC Filter
 add vsource V1 in 0 ac=1
 add resistor R1 in out 1k
@@ -145,3 +156,29 @@ exit
         assert result.exit_code == 0
         assert "RC Filter" in result.output
         assert ".ac" in result.output
+
+    def test_interactive_unknown_and_clear(self, runner: CliRunner) -> None:
+        """Test unknown commands, clear, and quit in interactive mode."""
+        commands = "bogus\nnew X\nclear\nshow\nquit\n"
+        result = runner.invoke(main, ["interactive"], input=commands)
+        assert result.exit_code == 0
+        assert "Unknown command: bogus" in result.output
+        assert "Circuit cleared" in result.output
+        assert "No circuit created" in result.output
+        assert "Goodbye" in result.output
+
+    def test_interactive_vsource_values(self, runner: CliRunner) -> None:
+        """Test dc=/ac= parsing for voltage sources in interactive mode."""
+        commands = "new X\nadd vsource V1 in 0 dc=5 ac=1e-3\nadd vsource V2 a 0 dc=x\nshow\nexit\n"
+        result = runner.invoke(main, ["interactive"], input=commands)
+        assert result.exit_code == 0
+        assert "V1 in 0 DC 5.0 AC 0.001" in result.output
+        assert "Invalid source value: dc=x" in result.output
+
+    def test_interactive_scripted_eof(self, runner: CliRunner) -> None:
+        """Test that piped input ends cleanly at EOF without an exit command."""
+        result = runner.invoke(main, ["interactive"], input="new X\nadd resistor R1 a b 1k\n")
+        assert result.exit_code == 0
+        assert "Added resistor R1" in result.output
+        assert "ohmspice>" not in result.output
+        assert result.output.rstrip().endswith("Goodbye!")
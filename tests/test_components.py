@@ -1,5 +1,7 @@
 """Tests for component classes."""
 
+import sys
+
 import pytest
 
 from ohmspice.components import (
@@ -7,69 +9,92 @@ from ohmspice.components import (
     Component,
     CurrentSource,
     Inductor,
+    PulseParams,
     Resistor,
+    SineParams,
     VoltageSource,
     format_value,
     parse_value,
 )
+from ohmspice.components.utils import _parse_value_str
 
 
 class TestParseValue:
     """Tests for value parsing utility."""
 
-    def test_parse_integer(self):
-        assert parse_value(1000) == 1000.0
-
-    def test_parse_float(self):
-        assert parse_value(1.5) == 1.5
-
-    def test_parse_string_no_suffix(self):
-        assert parse_value("1000") == 1000.0
-
-    def test_parse_kilo(self):
-        assert parse_value("1k") == 1000.0
-        assert parse_value("4.7k") == 4700.0
-
-    def test_parse_mega(self):
-        assert parse_value("1meg") == 1e6
-        assert parse_value("4.7meg") == 4.7e6
-
-    def test_parse_nano(self):
-        assert parse_value("100n") == pytest.approx(1e-7)
-        assert parse_value("159n") == pytest.approx(159e-9)
-
-    def test_parse_micro(self):
-        assert parse_value("10u") == pytest.approx(1e-5)
-        assert parse_value("4.7u") == pytest.approx(4.7e-6)
-
-    def test_parse_pico(self):
-        assert parse_value("100p") == 1e-10
-
-    def test_parse_milli(self):
-        assert parse_value("10m") == 0.01
-
-    def test_parse_case_insensitive(self):
-        assert parse_value("1K") == 1000.0
-        assert parse_value("1MEG") == 1e6
-
-    def test_parse_empty_raises(self):
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (1000, 1000.0),
+            (1.5, 1.5),
+            ("1000", 1000.0),
+            ("4.7k", 4700.0),
+            ("4.7meg", 4.7e6),
+            ("100n", 1e-7),
+            ("159n", 159e-9),
+            ("10u", 1e-5),
+            ("4.7u", 4.7e-6),
+            ("100p", 1e-10),
+            ("10m", 0.01),
+        ],
+    )
+    def test_parse_value(self, value, expected):
+        assert parse_value(value) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        ("suffix", "multiplier"),
+        [
+            ("f", 1e-15),
+            ("p", 1e-12),
+            ("n", 1e-9),
+            ("u", 1e-6),
+            ("µ", 1e-6),
+            ("m", 1e-3),
+            ("k", 1e3),
+            ("meg", 1e6),
+            ("g", 1e9),
+            ("t", 1e12),
+            ("K", 1e3),
+            ("MEG", 1e6),
+            ("Meg", 1e6),
+        ],
+    )
+    def test_parse_suffix(self, suffix, multiplier):
+        assert parse_value(f"1{suffix}") == pytest.approx(multiplier)
+
+    def test_parse_plain_number_strings(self):
+        assert parse_value("-1.5e-3") == -1.5e-3
+        assert parse_value("1E3") == 1000.0
+        assert parse_value("2.") == 2.0
+        assert parse_value("1E3k") == 1e6
+
+    def test_parse_units_and_leading_dot(self):
+        assert parse_value("10uF") == pytest.approx(1e-5)
+        assert parse_value("1kΩ") == 1000.0
+        assert parse_value("2 megohm") == 2e6
+        assert parse_value(".5k") == 500.0
+
+    def test_parse_string_memoized(self):
+        _parse_value_str.cache_clear()
+        parse_value("1k")
+        parse_value("1k")
+        assert _parse_value_str.cache_info().hits == 1
+
+    @pytest.mark.parametrize("value", ["", "abc"])
+    def test_parse_invalid_raises(self, value):
         with pytest.raises(ValueError):
-            parse_value("")
-
-    def test_parse_invalid_raises(self):
-        with pytest.raises(ValueError):
-            parse_value("abc")
+            parse_value(value)
 
 
 class TestFormatValue:
     """Tests for value formatting utility."""
 
-    def test_format_kilo(self):
-        assert format_value(1000) == "1k"
-        assert format_value(4700) == "4.7k"
-
-    def test_format_mega(self):
-        assert format_value(1e6) == "1meg"
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(1000, "1k"), (4700, "4.7k"), (1e6, "1meg"), (0, "0")],
+    )
+    def test_format_value(self, value, expected):
+        assert format_value(value) == expected
 
     def test_format_nano(self):
         result = format_value(1e-9)
@@ -79,8 +104,17 @@ class TestFormatValue:
         result = format_value(1e-9, "F")
         assert "F" in result
 
-    def test_format_zero(self):
-        assert format_value(0) == "0"
+    def test_format_memoized(self):
+        format_value.cache_clear()
+        format_value(4700, "Ω")
+        assert format_value(4700, "Ω") == "4.7kΩ"
+        assert format_value.cache_info().hits == 1
+
+    def test_format_range_edges(self):
+        assert format_value(1e-6) == "1u"
+        assert format_value(-2.2e-12) == "-2.2p"
+        assert format_value(5e15) == "5000T"
+        assert format_value(1e-18) == "1e-18"
 
 
 class TestResistor:
@@ -102,10 +136,50 @@ class TestResistor:
         r = Resistor("R1", "in", "out", "1k")
         assert r.to_spice() == "R1 in out 1k"
 
+    def test_to_spice_cached_until_changed(self):
+        r = Resistor("R1", "in", "out", "1k")
+        assert r.to_spice() is r.to_spice()
+        r.value_str = "2k"
+        assert r.to_spice() == "R1 in out 2k"
+        r.node2 = "gnd2"
+        assert r.to_spice() == "R1 in gnd2 2k"
+
+        c = Capacitor("C1", "out", "0", "1u")
+        c.to_spice()
+        c.initial_voltage = 1.5
+        assert c.to_spice() == "C1 out 0 1u IC=1.5"
+
+        v = VoltageSource("V1", "in", "0", dc=5)
+        v.to_spice()
+        v.dc = 3
+        assert v.to_spice() == "V1 in 0 DC 3"
+
+    def test_uses_slots(self):
+        r = Resistor("R1", "in", "out", "1k")
+        assert not hasattr(r, "__dict__")
+        with pytest.raises(AttributeError):
+            r.tolerance = 0.05
+
     def test_gnd_normalized(self):
         r = Resistor("R1", "in", "gnd", "1k")
         assert r.node2 == "0"
 
+    def test_node_names_shared(self):
+        r1 = Resistor("R1", "".join(["n", "1"]), "0", "1k")
+        r2 = Resistor("R2", "".join(["n", "1"]), "0", "2k")
+        assert r1.node1 is r2.node1
+        assert Resistor("".join(["R", "9"]), "a", "b", "1k").name is sys.intern("R9")
+
+    def test_unchecked(self):
+        r = Resistor.unchecked("R1", "in", "out", 1000.0)
+        assert r.value == 1000.0
+        assert r.to_spice() == "R1 in out 1000.0"
+        r = Resistor.unchecked("R2", "in", "0", 4700.0, "4.7k")
+        assert r.to_spice() == "R2 in 0 4.7k"
+        c = Capacitor.unchecked("C1", "out", "0", 1e-7, "100n", initial_voltage=5.0)
+        assert c.to_spice() == "C1 out 0 100n IC=5.0"
+        assert Inductor.unchecked("L1", "a", "b", 0.01, "10m").to_spice() == "L1 a b 10m"
+
     def test_invalid_name_raises(self):
         with pytest.raises(ValueError, match="must start with 'R'"):
             Resistor("C1", "in", "out", "1k")
@@ -185,6 +259,18 @@ class TestVoltageSource:
         v = VoltageSource("V1", "in", "0", sine={"vo": 0, "va": 1, "freq": 1000})
         assert "SINE(" in v.to_spice()
 
+    def test_waveform_params(self):
+        v = VoltageSource("V1", "in", "0", sine={"va": 1, "freq": 1000})
+        assert v.sine == SineParams(va=1, freq=1000)
+        assert v.to_spice() == "V1 in 0 SINE(0 1 1000)"
+        v.pulse = PulseParams(v2=5, per=1e-3)
+        assert v.pulse.v2 == 5
+        assert "PULSE(0 5 0 0 0 0 0.001)" in v.to_spice()
+
+    def test_unknown_waveform_param_raises(self):
+        with pytest.raises(ValueError, match="Unknown sine parameter"):
+            VoltageSource("V1", "in", "0", sine={"amplitude": 1})
+
     def test_invalid_name_raises(self):
         with pytest.raises(ValueError, match="must start with 'V'"):
             VoltageSource("I1", "in", "0", dc=5)
@@ -209,3 +295,32 @@ class TestCurrentSource:
     def test_invalid_name_raises(self):
         with pytest.raises(ValueError, match="must start with 'I'"):
             CurrentSource("V1", "in", "0", dc=0.001)
+
+
+class TestComponentSubclass:
+    """Tests for user-defined Component subclasses."""
+
+    def test_subclass_overriding_to_spice(self):
+        class Diode(Component):
+            PREFIX = "D"
+
+            def __init__(self, name, node1, node2, model):
+                super().__init__(name, node1, node2)
+                self.model = model
+
+            def to_spice(self):
+                return f"{self.name} {self.node1} {self.node2} {self.model}"
+
+        d = Diode("D1", "a", "b", "1N4148")
+        assert d.to_spice() == "D1 a b 1N4148"
+        d.model = "1N914"
+        assert d.to_spice() == "D1 a b 1N914"
+
+    def test_subclass_without_netlist_line_raises(self):
+        class Diode(Component):
+            PREFIX = "D"
+
+        with pytest.raises(TypeError):
+            Diode("D1", "a", "b")
+        with pytest.raises(TypeError):
+            Component("X1", "a", "b")
@@ -1,10 +1,16 @@
 """Tests for LTspice simulator backend."""
 
+import sys
+from pathlib import Path
+
 import pytest
 
 from ohmspice import Circuit
 from ohmspice.simulators import LTSpice
-from ohmspice.simulators.base import SimulatorNotFoundError
+from ohmspice.simulators.base import SimulationError, SimulatorNotFoundError
+
+# Probed once at collection time for the skipif markers below
+_LTSPICE_AVAILABLE = LTSpice.is_available()
 
 
 class TestLTSpiceDetection:
@@ -16,13 +22,51 @@ class TestLTSpiceDetection:
         available = LTSpice.is_available()
         assert isinstance(available, bool)
 
+    def test_is_available_cached(self, monkeypatch):
+        """Check that availability is probed once until the cache is reset."""
+        calls = []
+
+        def fake_find_executable():
+            calls.append(1)
+            return None
+
+        LTSpice.reset_availability_cache()
+        monkeypatch.setattr(LTSpice, "find_executable", fake_find_executable)
+        try:
+            assert LTSpice.is_available() is False
+            assert LTSpice.is_available() is False
+            assert len(calls) == 1
+
+            LTSpice.reset_availability_cache()
+            LTSpice.is_available()
+            assert len(calls) == 2
+        finally:
+            LTSpice.reset_availability_cache()
+
+    def test_find_executable_cached(self, monkeypatch):
+        """Check that the filesystem search runs once until the cache is reset."""
+        calls = []
+
+        def fake_search():
+            calls.append(1)
+            return None
+
+        LTSpice.reset_availability_cache()
+        monkeypatch.setattr(LTSpice, "_search_executable", fake_search)
+        try:
+            assert LTSpice.find_executable() is None
+            assert LTSpice.find_executable() is None
+            assert len(calls) == 1
+        finally:
+            LTSpice.reset_availability_cache()
+
     def test_find_executable(self):
         """Check if executable finding works."""
         path = LTSpice.find_executable()
         # Path can be None if LTspice not installed
         assert path is None or path.exists()
 
-    @pytest.mark.skipif(not LTSpice.is_available(), reason="LTspice not installed")
+    @pytest.mark.skipif(not _LTSPICE_AVAILABLE, reason="LTspice not installed")
     def test_create_instance(self):
         """Test creating LTspice instance when available."""
         sim = LTSpice()
@@ -32,18 +76,19 @@ class TestLTSpiceDetection:
 class TestLTSpiceNotAvailable:
     """Tests when LTspice is not available."""
 
-    @pytest.mark.skipif(LTSpice.is_available(), reason="LTspice is installed")
+    @pytest.mark.skipif(_LTSPICE_AVAILABLE, reason="LTspice is installed")
     def test_create_raises_when_not_available(self):
         """Test that creating LTspice raises error when not installed."""
         with pytest.raises(SimulatorNotFoundError):
             LTSpice()
 
 
-@pytest.mark.skipif(not LTSpice.is_available(), reason="LTspice not installed")
+@pytest.mark.slow
+@pytest.mark.skipif(not _LTSPICE_AVAILABLE, reason="LTspice not installed")
 class TestLTSpiceSimulation:
     """Integration tests for LTspice simulation.
 
-    These tests only run if LTspice is installed.
+    These tests only run if LTspice is installed and --run-slow is given.
     """
 
     def test_run_simple_circuit(self):
@@ -83,3 +128,75 @@ class TestLTSpiceSimulation:
         sim = LTSpice()
         with pytest.raises(FileNotFoundError):
             sim.run_netlist("nonexistent.cir")
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as the executable")
+class TestLTSpiceScratchDir:
+    """Tests for the reusable simulation scratch directories."""
+
+    @pytest.fixture
+    def fake_sim(self, tmp_path):
+        executable = tmp_path / "ltspice"
+        executable.write_text("#!/bin/sh\nexit 0\n")
+        executable.chmod(0o755)
+        return LTSpice(executable)
+
+    def test_netlist_path_reused(self, fake_sim, monkeypatch):
+        netlists = []
+
+        def fake_run_netlist(netlist_path, *, timeout):
+            netlists.append(netlist_path.read_text())
+            netlist_path.with_suffix(".raw").write_bytes(b"raw")
+            netlist_path.with_suffix(".log").write_text("log")
+            return netlist_path
+
+        monkeypatch.setattr(fake_sim, "run_netlist", fake_run_netlist)
+        circuit = Circuit("Test")
+        circuit.add_voltage_source("V1", "in", "0", dc=5)
+        circuit.add_resistor("R1", "in", "0", "1k")
+
+        netlist_path = fake_sim.run(circuit)
+        assert netlists[0].startswith("* Test")
+        assert fake_sim.run(circuit) == netlist_path
+
+        # Outputs are not kept around once the results are parsed
+        for suffix in (".cir", ".raw", ".log"):
+            assert not netlist_path.with_suffix(suffix).exists()
+
+    def test_outputs_removed_after_failed_run(self, fake_sim):
+        circuit = Circuit("Test")
+        circuit.add_voltage_source("V1", "in", "0", dc=5)
+        circuit.add_resistor("R1", "in", "0", "1k")
+
+        with pytest.raises(SimulationError):
+            fake_sim.run(circuit)
+        (workdir,) = fake_sim._idle_workdirs
+        assert list(workdir.iterdir()) == []
+
+    def test_run_batch_uses_separate_workdirs(self, fake_sim, monkeypatch):
+        workdirs = []
+
+        def fake_run_netlist(netlist_path, *, timeout):
+            workdirs.append(netlist_path.parent)
+            return netlist_path.read_text().splitlines()[0]
+
+        monkeypatch.setattr(fake_sim, "run_netlist", fake_run_netlist)
+        circuits = []
+        for i in range(8):
+            circuit = Circuit(f"Run {i}")
+            circuit.add_voltage_source("V1", "in", "0", dc=i)
+            circuits.append(circuit)
+
+        results = fake_sim.run_batch(circuits, max_workers=4)
+        assert results == [f"* Run {i}" for i in range(8)]
+        assert 1 <= len(set(workdirs)) <= 4
+
+        # Later batches reuse the same directories instead of creating more
+        fake_sim.run_batch(circuits, max_workers=4)
+        assert len(set(workdirs)) == len(fake_sim._idle_workdirs) <= 4
+
+    def test_command_follows_executable(self, fake_sim, tmp_path):
+        assert fake_sim._cmd_prefix == [str(tmp_path / "ltspice"), "-b", "-Run"]
+        fake_sim.executable = "/opt/ltspice"
+        assert fake_sim.executable == Path("/opt/ltspice")
+        assert fake_sim._cmd_prefix[0] == str(Path("/opt/ltspice"))
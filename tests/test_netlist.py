@@ -5,13 +5,18 @@ import pytest
 from ohmspice import Circuit, NetlistGenerator
 
 
+@pytest.fixture
+def circuit():
+    """Single-resistor circuit."""
+    circuit = Circuit("Test")
+    circuit.add_resistor("R1", "a", "b", "1k")
+    return circuit
+
+
 class TestNetlistGenerator:
     """Tests for NetlistGenerator class."""
 
-    def test_generate(self):
-        circuit = Circuit("Test")
-        circuit.add_resistor("R1", "a", "b", "1k")
-
+    def test_generate(self, circuit):
         generator = NetlistGenerator()
         netlist = generator.generate(circuit)
 
@@ -19,10 +24,7 @@ class TestNetlistGenerator:
         assert "R1 a b 1k" in netlist
         assert ".end" in netlist
 
-    def test_save(self, tmp_path):
-        circuit = Circuit("Test")
-        circuit.add_resistor("R1", "a", "b", "1k")
-
+    def test_save(self, circuit, tmp_path):
         generator = NetlistGenerator()
         filepath = generator.save(circuit, tmp_path / "test")
 
@@ -30,22 +32,22 @@ class TestNetlistGenerator:
         assert filepath.suffix == ".cir"
         assert filepath.exists()
 
-    def test_save_with_extension(self, tmp_path):
-        circuit = Circuit("Test")
-        circuit.add_resistor("R1", "a", "b", "1k")
-
+    def test_save_with_extension(self, circuit, tmp_path):
         generator = NetlistGenerator()
         filepath = generator.save(circuit, tmp_path / "test.net")
 
         # Should keep .net extension
         assert filepath.suffix == ".net"
 
-    def test_save_creates_directories(self, tmp_path):
-        circuit = Circuit("Test")
-        circuit.add_resistor("R1", "a", "b", "1k")
-
+    def test_save_creates_directories(self, circuit, tmp_path):
         generator = NetlistGenerator()
         filepath = generator.save(circuit, tmp_path / "subdir" / "test.cir")
 
         assert filepath.exists()
         assert filepath.parent.name == "subdir"
+        assert filepath.read_text(encoding="utf-8") == circuit.to_netlist() + "\n"
+
+    def test_save_matches_circuit_save(self, circuit, tmp_path):
+        filepath = NetlistGenerator().save(circuit, tmp_path / "generator.cir")
+        circuit.save(tmp_path / "circuit.cir")
+        assert filepath.read_bytes() == (tmp_path / "circuit.cir").read_bytes()
@@ -1,5 +1,10 @@
 """Test OhmSPICE package initialization."""
 
+import subprocess
+import sys
+
+import pytest
+
 import ohmspice
 
 
@@ -13,3 +18,23 @@ def test_author():
     """Test that author is defined."""
     assert hasattr(ohmspice, "__author__")
     assert ohmspice.__author__ == "Eray Erdogan"
+
+
+def test_lazy_exports():
+    """Test that every name in __all__ resolves."""
+    for name in ohmspice.__all__:
+        assert hasattr(ohmspice, name)
+    assert set(ohmspice.__all__) <= set(dir(ohmspice))
+
+
+def test_unknown_attribute_raises():
+    """Test that unknown attributes raise AttributeError."""
+    with pytest.raises(AttributeError):
+        ohmspice.NotAThing  # noqa: B018
+
+
+def test_import_does_not_load_numpy():
+    """Test that importing the package alone does not import NumPy."""
+    code = "import sys, ohmspice; ohmspice.Circuit; sys.exit('numpy' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code])
+    assert result.returncode == 0
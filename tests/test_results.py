@@ -0,0 +1,284 @@
+"""Tests for simulation results parsing."""
+
+import numpy as np
+import pytest
+
+from ohmspice.analysis import SimulationResults
+from ohmspice.analysis.results import AnalysisType
+
+
+def write_raw(path, plotname, variables, columns, *, complex_data=False, encoding="utf-16-le"):
+    """Write a minimal LTspice-style binary .raw file.
+
+    Args:
+        path: Destination path.
+        plotname: Plotname header value.
+        variables: List of (name, type) tuples.
+        columns: List of 1D arrays, one per variable.
+        complex_data: Store dependent variables as complex doubles.
+        encoding: Header text encoding.
+    """
+    num_points = len(columns[0])
+    header_lines = [
+        "Title: * test",
+        f"Plotname: {plotname}",
+        f"Flags: {'complex' if complex_data else 'real'} forward",
+        f"No. Variables: {len(variables)}",
+        f"No. Points: {num_points}",
+        "Variables:",
+    ]
+    for idx, (name, var_type) in enumerate(variables):
+        header_lines.append(f"\t{idx}\t{name}\t{var_type}")
+    header = "\n".join(header_lines) + "\nBinary:\n"
+
+    fields = [("x", "<f8")]
+    value_dtype = "<c16" if complex_data else "<f8"
+    fields += [(f"v{i}", value_dtype) for i in range(1, len(variables))]
+    records = np.empty(num_points, dtype=fields)
+    for i, column in enumerate(columns):
+        records[records.dtype.names[i]] = column
+
+    path.write_bytes(header.encode(encoding) + records.tobytes())
+    return path
+
+
+@pytest.fixture
+def transient_raw(tmp_path):
+    """Transient analysis .raw file with two node voltages and a current."""
+    time = np.linspace(0, 1e-3, 50)
+    columns = [time, np.sin(time * 1e4), np.cos(time * 1e4), time * 2]
+    variables = [
+        ("time", "time"),
+        ("V(in)", "voltage"),
+        ("V(out)", "voltage"),
+        ("I(R1)", "device_current"),
+    ]
+    return write_raw(tmp_path / "tran.raw", "Transient Analysis", variables, columns), columns
+
+
+@pytest.fixture
+def ac_raw(tmp_path):
+    """AC analysis .raw file with complex node voltages."""
+    freq = np.logspace(0, 6, 61)
+    h = 1 / (1 + 1j * freq / 1000)
+    columns = [freq, np.ones_like(h), h]
+    variables = [("frequency", "frequency"), ("V(in)", "voltage"), ("V(out)", "voltage")]
+    path = write_raw(tmp_path / "ac.raw", "AC Analysis", variables, columns, complex_data=True)
+    return path, columns
+
+
+class TestParsing:
+    """Tests for .raw file parsing."""
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            SimulationResults(tmp_path / "missing.raw")
+
+    def test_transient_header(self, transient_raw):
+        path, _ = transient_raw
+        results = SimulationResults(path)
+        assert results.analysis_type == AnalysisType.TRANSIENT
+        assert results.variables == ["time", "V(in)", "V(out)", "I(R1)"]
+
+    def test_transient_data(self, transient_raw):
+        path, columns = transient_raw
+        results = SimulationResults(path)
+        np.testing.assert_array_equal(results.get_time(), columns[0])
+        np.testing.assert_array_equal(results.get_voltage("out"), columns[2])
+        np.testing.assert_array_equal(results.get_current("R1"), columns[3])
+
+    def test_ac_data(self, ac_raw):
+        path, columns = ac_raw
+        results = SimulationResults(path)
+        assert results.analysis_type == AnalysisType.AC_ANALYSIS
+        np.testing.assert_array_equal(results.get_frequency(), columns[0])
+        np.testing.assert_allclose(results.get_voltage("out"), np.abs(columns[2]))
+        np.testing.assert_allclose(results.get_phase("out"), np.angle(columns[2], deg=True))
+
+    def test_ascii_header(self, tmp_path):
+        time = np.linspace(0, 1, 10)
+        variables = [("time", "time"), ("V(out)", "voltage")]
+        path = write_raw(
+            tmp_path / "ascii.raw", "Transient Analysis", variables, [time, time], encoding="ascii"
+        )
+        results = SimulationResults(path)
+        assert results.variables == ["time", "V(out)"]
+        np.testing.assert_array_equal(results.get_voltage("out"), time)
+
+    def test_header_beyond_search_limit(self, transient_raw, monkeypatch):
+        path, columns = transient_raw
+        monkeypatch.setattr("ohmspice.analysis.results.HEADER_SEARCH_LIMIT", 64)
+        results = SimulationResults(path)
+        np.testing.assert_array_equal(results.get_voltage("in"), columns[1])
+
+    def test_empty_file_raises(self, tmp_path):
+        path = tmp_path / "empty.raw"
+        path.write_bytes(b"")
+        with pytest.raises(ValueError):
+            SimulationResults(path)
+
+    def test_missing_header_end_raises(self, tmp_path):
+        path = tmp_path / "bad.raw"
+        path.write_bytes(b"Title: * test\n" + b"\x00" * 100)
+        with pytest.raises(ValueError, match="end of header"):
+            SimulationResults(path)
+
+    def test_magnitude_and_phase_cached(self, ac_raw):
+        path, _ = ac_raw
+        results = SimulationResults(path)
+        assert results.get_voltage("out") is results.get_voltage("out")
+        assert results.get_phase("out") is results.get_phase("out")
+
+    def test_truncated_data(self, transient_raw):
+        path, columns = transient_raw
+        content = path.read_bytes()
+        path.write_bytes(content[: len(content) - 40])
+        results = SimulationResults(path)
+        assert len(results.get_time()) == len(columns[0]) - 2
+        np.testing.assert_array_equal(results.get_time(), columns[0][:-2])
+
+    def test_file_changed_after_load(self, transient_raw):
+        path, columns = transient_raw
+        results = SimulationResults(path)
+
+        # Rerunning a simulation rewrites the same .raw file in place
+        variables = [("time", "time"), ("V(in)", "voltage"), ("V(out)", "voltage")]
+        write_raw(path, "Transient Analysis", variables, [np.full(3, 7.0)] * 3)
+        np.testing.assert_array_equal(results.get_voltage("out"), columns[2])
+
+        path.write_bytes(b"")
+        np.testing.assert_array_equal(results.get_voltage("in"), columns[1])
+        path.unlink()
+        np.testing.assert_array_equal(results.matrix[:, 3], columns[3])
+
+    def test_load_many(self, transient_raw, ac_raw):
+        (tran_path, tran_columns), (ac_path, _) = transient_raw, ac_raw
+        results = SimulationResults.load_many([ac_path, tran_path], max_workers=2)
+        assert [r.analysis_type for r in results] == [
+            AnalysisType.AC_ANALYSIS,
+            AnalysisType.TRANSIENT,
+        ]
+        np.testing.assert_array_equal(results[1].get_time(), tran_columns[0])
+
+    def test_load_many_missing_file_raises(self, transient_raw, tmp_path):
+        path, _ = transient_raw
+        with pytest.raises(FileNotFoundError):
+            SimulationResults.load_many([path, tmp_path / "missing.raw"])
+
+
+class TestAccessors:
+    """Tests for result accessors."""
+
+    def test_independent_variable_cached(self, ac_raw):
+        path, _ = ac_raw
+        results = SimulationResults(path)
+        assert results.get_frequency() is results.get_frequency()
+        with pytest.raises(ValueError, match="No time data"):
+            results.get_time()
+
+    def test_point_range(self, ac_raw):
+        path, columns = ac_raw
+        results = SimulationResults(path)
+        expected = np.abs(columns[2][10:20])
+        np.testing.assert_allclose(results.get_voltage("out", 10, 20), expected)
+        results.get_voltage("out")
+        np.testing.assert_allclose(results.get_voltage("out", start=10, stop=20), expected)
+        assert len(results.get_phase("out", stop=5)) == 5
+
+    def test_nearest_index(self, ac_raw):
+        path, columns = ac_raw
+        results = SimulationResults(path)
+        idx = results.nearest_index("out", 10 ** (-3 / 20))
+        assert columns[0][idx] == pytest.approx(1000, rel=0.15)
+
+    def test_unknown_node_raises(self, transient_raw):
+        path, _ = transient_raw
+        results = SimulationResults(path)
+        with pytest.raises(KeyError):
+            results.get_voltage("nonexistent")
+
+    def test_lookup_is_case_insensitive(self, transient_raw):
+        path, columns = transient_raw
+        results = SimulationResults(path)
+        np.testing.assert_array_equal(results.get_voltage("OUT"), columns[2])
+        np.testing.assert_array_equal(results.get_voltage("v(in)"), columns[1])
+        np.testing.assert_array_equal(results.get_current("r1"), columns[3])
+
+    def test_phase_of_real_data_raises(self, transient_raw):
+        path, _ = transient_raw
+        results = SimulationResults(path)
+        with pytest.raises(ValueError):
+            results.get_phase("out")
+
+    def test_get_variable(self, transient_raw):
+        path, columns = transient_raw
+        results = SimulationResults(path)
+        np.testing.assert_array_equal(results.get_variable("V(in)"), columns[1])
+        assert results.variable_names == ["time", "V(in)", "V(out)", "I(R1)"]
+
+    def test_data_is_dict(self, transient_raw):
+        path, columns = transient_raw
+        results = SimulationResults(path)
+        assert list(results.data) == results.variables
+        results.data["V(out)"] = columns[1]
+        np.testing.assert_array_equal(results.get_voltage("out"), columns[1])
+
+    def test_matrix(self, ac_raw):
+        path, columns = ac_raw
+        results = SimulationResults(path)
+        matrix = results.matrix
+        assert matrix.shape == (len(columns[0]), 3)
+        np.testing.assert_array_equal(matrix[:, 2], columns[2])
+        assert np.shares_memory(results.get_variable("V(out)"), matrix)
+        assert results.get_variable("frequency").dtype == np.float64
+
+    def test_zero_copy_views(self, ac_raw):
+        path, columns = ac_raw
+        results = SimulationResults(path, copy=False)
+        freq = results.get_variable("frequency")
+        assert not freq.flags.writeable
+        np.testing.assert_array_equal(freq, columns[0])
+        np.testing.assert_allclose(results.get_voltage("out"), np.abs(columns[2]))
+        np.testing.assert_array_equal(results.matrix[:, 2], columns[2])
+
+    def test_repr(self, ac_raw):
+        path, _ = ac_raw
+        results = SimulationResults(path)
+        assert "AC Analysis" in repr(results)
+
+
+class TestCache:
+    """Tests for the parsed-results sidecar cache."""
+
+    def test_cache_not_written_by_default(self, transient_raw):
+        path, _ = transient_raw
+        results = SimulationResults(path)
+        assert not results.cache_file.exists()
+
+    def test_cache_roundtrip(self, ac_raw):
+        path, columns = ac_raw
+        first = SimulationResults(path, use_cache=True)
+        assert first.cache_file.exists()
+
+        cached = SimulationResults(path, use_cache=True)
+        assert cached.analysis_type == AnalysisType.AC_ANALYSIS
+        assert cached.variables == first.variables
+        np.testing.assert_array_equal(cached.get_frequency(), columns[0])
+        np.testing.assert_allclose(cached.get_voltage("out"), np.abs(columns[2]))
+
+    def test_stale_cache_reparsed(self, transient_raw):
+        path, columns = transient_raw
+        SimulationResults(path, use_cache=True)
+
+        content = path.read_bytes()
+        path.write_bytes(content[: len(content) - 40])
+        results = SimulationResults(path, use_cache=True)
+        assert len(results.get_time()) == len(columns[0]) - 2
+
+    def test_corrupt_cache_ignored(self, transient_raw):
+        path, columns = transient_raw
+        results = SimulationResults(path)
+        results.cache_file.write_bytes(b"not a cache")
+
+        results = SimulationResults(path, use_cache=True)
+        np.testing.assert_array_equal(results.get_time(), columns[0])
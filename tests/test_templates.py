@@ -1,13 +1,28 @@
 """Tests for circuit templates."""
 
 import math
+import subprocess
+import sys
 
 import pytest
 
-from ohmspice.templates import filters, amplifiers, oscillators, power
+from ohmspice.templates import (
+    amplifiers,
+    filters,
+    get_template,
+    list_all_templates,
+    oscillators,
+    power,
+)
 from ohmspice.templates.base import CircuitTemplate, TemplateInfo, TemplateParameter
 
 
+def _assert_all_in(netlist: str, *tokens: str) -> None:
+    """Assert that every token appears in the netlist, reporting all missing ones."""
+    missing = [token for token in tokens if token not in netlist]
+    assert not missing, f"missing from netlist: {missing}"
+
+
 class TestTemplateBase:
     """Tests for template base classes."""
 
@@ -29,6 +44,20 @@ class TestTemplateBase:
         assert info.parameters[0].required is True
         assert info.parameters[1].default == 1000
 
+    def test_template_info_cached_and_frozen(self) -> None:
+        """Test that info() returns one shared, immutable instance."""
+        info = filters.RCLowPassTemplate.info()
+        assert filters.RCLowPassTemplate.info() is info
+        assert isinstance(info.parameters, tuple)
+        with pytest.raises(AttributeError):
+            info.name = "changed"  # type: ignore[misc]
+
+    def test_validate_params(self) -> None:
+        """Test that missing required parameters are reported."""
+        template = filters.RCLowPassTemplate()
+        assert template.validate_params(fc=1000) == []
+        assert template.validate_params(r=1000) == ["Missing required parameter: fc"]
+
 
 class TestFilterTemplates:
     """Tests for filter templates."""
@@ -39,9 +68,7 @@ class TestFilterTemplates:
         assert circuit is not None
         assert "RC Low-Pass Filter" in circuit.name
         netlist = circuit.to_netlist()
-        assert "R1" in netlist
-        assert "C1" in netlist
-        assert ".ac" in netlist
+        _assert_all_in(netlist, "R1", "C1", ".ac")
 
     def test_rc_lowpass_with_c(self) -> None:
         """Test RC low-pass filter with C specified."""
@@ -74,18 +101,14 @@ class TestFilterTemplates:
         circuit = filters.rlc_bandpass(fc=1000, q=10, r=100)
         assert circuit is not None
         netlist = circuit.to_netlist()
-        assert "R1" in netlist
-        assert "L1" in netlist
-        assert "C1" in netlist
+        _assert_all_in(netlist, "R1", "L1", "C1")
 
     def test_rlc_notch(self) -> None:
         """Test RLC notch filter."""
         circuit = filters.rlc_notch(fc=60, q=20, r=100)
         assert circuit is not None
         netlist = circuit.to_netlist()
-        assert "R1" in netlist
-        assert "L1" in netlist
-        assert "C1" in netlist
+        _assert_all_in(netlist, "R1", "L1", "C1")
 
     def test_filter_templates_list(self) -> None:
         """Test filter template listing."""
@@ -152,10 +175,7 @@ class TestOscillatorTemplates:
         circuit = oscillators.wien_bridge(frequency=1000, r=10000)
         assert circuit is not None
         netlist = circuit.to_netlist()
-        assert "R1" in netlist
-        assert "R2" in netlist
-        assert "C1" in netlist
-        assert "C2" in netlist
+        _assert_all_in(netlist, "R1", "R2", "C1", "C2")
 
     def test_wien_bridge_calculate_values(self) -> None:
         """Test Wien bridge value calculation."""
@@ -173,21 +193,42 @@ class TestOscillatorTemplates:
         assert circuit is not None
         netlist = circuit.to_netlist()
         # 3 stages
-        assert "R1" in netlist
-        assert "R2" in netlist
-        assert "R3" in netlist
-        assert "C1" in netlist
-        assert "C2" in netlist
-        assert "C3" in netlist
+        _assert_all_in(netlist, "R1", "R2", "R3", "C1", "C2", "C3")
 
     def test_colpitts(self) -> None:
         """Test Colpitts oscillator tank."""
         circuit = oscillators.colpitts(frequency=1e6)
         assert circuit is not None
         netlist = circuit.to_netlist()
-        assert "L1" in netlist
-        assert "C1" in netlist
-        assert "C2" in netlist
+        _assert_all_in(netlist, "L1", "C1", "C2")
+
+    def test_calculate_values_cached(self) -> None:
+        """Test that oscillator values are computed once per parameter set."""
+        oscillators._colpitts_values.cache_clear()
+        template = oscillators._colpitts_template
+        first = template.calculate_values(frequency=5e5, c_ratio=2)
+        first["l"] = 0
+        second = template.calculate_values(frequency=5e5, c_ratio=2)
+        assert second["l"] == 1e-3
+        assert second["c1"] == pytest.approx(2 * second["c2"])
+        assert oscillators._colpitts_values.cache_info().hits == 1
+
+    def test_batch_matches_single(self) -> None:
+        """Test that batch factories produce the same netlists as single calls."""
+        freqs = [50.0, 1000.0, 2.5e4, 3e6]
+        for batch, single in [
+            (oscillators.wien_bridge_batch, oscillators.wien_bridge),
+            (oscillators.phase_shift_batch, oscillators.phase_shift),
+        ]:
+            circuits = batch(freqs, r=4700)
+            assert len(circuits) == len(freqs)
+            for f, circuit in zip(freqs, circuits, strict=True):
+                assert circuit.to_netlist() == single(f, r=4700).to_netlist()
+
+        for kwargs in [{}, {"inductance": 1e-4, "c_ratio": 3}]:
+            batch = oscillators.colpitts_batch(freqs, **kwargs)
+            for f, circuit in zip(freqs, batch, strict=True):
+                assert circuit.to_netlist() == oscillators.colpitts(f, **kwargs).to_netlist()
 
 
 class TestPowerTemplates:
@@ -198,9 +239,7 @@ class TestPowerTemplates:
         circuit = power.voltage_divider(vout=3.3, vin=5, r2=10000)
         assert circuit is not None
         netlist = circuit.to_netlist()
-        assert "R1" in netlist
-        assert "R2" in netlist
-        assert ".op" in netlist
+        _assert_all_in(netlist, "R1", "R2", ".op")
 
     def test_voltage_divider_calculate_values(self) -> None:
         """Test voltage divider value calculation."""
@@ -222,9 +261,7 @@ class TestPowerTemplates:
         circuit = power.half_wave_rectifier(frequency=60, load_r=1000)
         assert circuit is not None
         netlist = circuit.to_netlist()
-        assert "Rload" in netlist
-        assert "Cfilter" in netlist
-        assert ".tran" in netlist
+        _assert_all_in(netlist, "Rload", "Cfilter", ".tran")
 
     def test_full_wave_rectifier(self) -> None:
         """Test full wave rectifier."""
@@ -234,13 +271,30 @@ class TestPowerTemplates:
         assert "Rload" in netlist
 
 
+class TestTemplateCaching:
+    """Tests for cached template circuit creation."""
+
+    def test_factory_returns_fresh_copies(self) -> None:
+        """Test that repeated factory calls return equal but independent circuits."""
+        first = filters.rc_lowpass(fc=1234)
+        second = filters.rc_lowpass(fc=1234)
+        assert first is not second
+        assert first.to_netlist() == second.to_netlist()
+
+        first.add_resistor("R9", "out", "0", "10k")
+        assert "R9" not in filters.rc_lowpass(fc=1234).to_netlist()
+
+    def test_int_and_float_parameters_cached_separately(self) -> None:
+        """Test that 1000 and 1000.0 keep their own circuit titles."""
+        assert filters.rc_lowpass(fc=1000).name == "RC Low-Pass Filter (fc=1000Hz)"
+        assert filters.rc_lowpass(fc=1000.0).name == "RC Low-Pass Filter (fc=1000.0Hz)"
+
+
 class TestTemplateRegistry:
     """Tests for template registry functions."""
 
     def test_list_all_templates(self) -> None:
         """Test listing all templates."""
-        from ohmspice.templates import list_all_templates
-
         all_templates = list_all_templates()
         assert "filters" in all_templates
         assert "amplifiers" in all_templates
@@ -255,8 +309,6 @@ class TestTemplateRegistry:
 
     def test_get_template(self) -> None:
         """Test getting template by name."""
-        from ohmspice.templates import get_template
-
         template = get_template("rc_lowpass")
         assert template is not None
         assert isinstance(template, CircuitTemplate)
@@ -266,3 +318,30 @@ class TestTemplateRegistry:
 
         template = get_template("nonexistent")
         assert template is None
+
+    def test_get_template_imports_only_needed_categories(self) -> None:
+        """Test that a filter lookup does not import later categories."""
+        code = (
+            "import sys\n"
+            "from ohmspice.templates import get_template\n"
+            "assert get_template('rc_lowpass') is not None\n"
+            "sys.exit('ohmspice.templates.power' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code])
+        assert result.returncode == 0
+
+    def test_registries_are_read_only(self) -> None:
+        """Test that the category registries cannot be modified."""
+        with pytest.raises(TypeError):
+            filters.FILTER_TEMPLATES["custom"] = filters.RCLowPassTemplate()  # type: ignore[index]
+
+    def test_listing_templates_does_not_import_circuit(self) -> None:
+        """Test that template metadata is available without the circuit machinery."""
+        code = (
+            "import sys\n"
+            "from ohmspice.templates import list_all_templates\n"
+            "list_all_templates()\n"
+            "sys.exit('ohmspice.circuit' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code])
+        assert result.returncode == 0